@@ -73,6 +73,9 @@ class BitLayoutDatabase:
         self._bram_layout: Dict[int, BitDescriptor] = {}
         self._clk_layout: Dict[int, BitDescriptor] = {}
         
+        # Per-instance cache for get_routing_bits(), keyed by FAR
+        self._routing_bits_cache: Dict[int, List[BitDescriptor]] = {}
+        
         # Build layouts
         self._build_clb_layout()
         self._build_iob_layout()
@@ -264,7 +267,16 @@ class BitLayoutDatabase:
         return None
     
     def get_routing_bits(self, far_value: int) -> List[BitDescriptor]:
-        """Get all routing-related bits in a frame"""
+        """
+        Get all routing-related bits in a frame
+        
+        Results are cached per frame address; callers must not modify
+        the returned list.
+        """
+        routing_bits = self._routing_bits_cache.get(far_value)
+        if routing_bits is not None:
+            return routing_bits
+        
         routing_bits = []
         
         for bit in range(1312):
@@ -272,6 +284,7 @@ class BitLayoutDatabase:
             if descriptor and descriptor.is_routing_critical:
                 routing_bits.append(descriptor)
         
+        self._routing_bits_cache[far_value] = routing_bits
         return routing_bits
     
     def get_security_sensitive_bits(self, far_value: int) -> List[BitDescriptor]:
@@ -7,9 +7,12 @@ Phase 2.2: Convert frame bits to active routing paths
 Part of: Turning the Table - FPGA Trojan Detection
 """
 
+import sys
 from typing import Dict, List, Set, Tuple, Optional
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import defaultdict, Counter
+from types import MappingProxyType
+from array import array
 
 # Import device model
 from analysis.device_model import DeviceModel
@@ -26,10 +29,14 @@ from src.mapping.integration.bitstream_loader import LoadedBitstream
 from src.mapping.integration.frame_obj_adapter import AdaptedFrame
 
 # Import analysis infrastructure
-from analysis.assembler.frame_mapper import FrameMapper
+from analysis.assembler.frame_mapper import FrameMapper, FrameCoverage
 from analysis.assembler.reverse_mapper import ReverseMapper
 
 
+# Unconfigured frame (41 words x 4 bytes, all zero)
+_ZERO_FRAME_BYTES = bytes(164)
+
+
 @dataclass
 class ActivePIP:
     """
@@ -84,24 +91,49 @@ class RoutingConfiguration:
     Complete routing configuration state from a bitstream
     
     This is the "active routing graph" - showing which PIPs are ON.
+    
+    PIPs are stored once in insertion order; pip_by_tile maps each tile
+    to a compact array of indices into that list rather than a set of
+    PIP objects per tile.
     """
     bitstream_id: str
     active_pips: Set[ActivePIP] = field(default_factory=set)
-    pip_by_tile: Dict[str, Set[ActivePIP]] = field(default_factory=lambda: defaultdict(set))
+    pip_by_tile: Dict[str, array] = field(default_factory=lambda: defaultdict(lambda: array('I')))
     pip_by_frame: Dict[int, Set[ActivePIP]] = field(default_factory=lambda: defaultdict(set))
     
     # Routing paths (computed on-demand)
     _paths_cache: Optional[List[RoutingPath]] = None
     
+    # Global PIP table indexed by pip_by_tile entries
+    _pips: List[ActivePIP] = field(default_factory=list)
+    
     def add_pip(self, pip: ActivePIP):
         """Add an active PIP to the configuration"""
-        self.active_pips.add(pip)
-        self.pip_by_tile[pip.tile_name].add(pip)
         self.pip_by_frame[pip.frame_address].add(pip)
+        if pip in self.active_pips:
+            return
+        self.active_pips.add(pip)
+        self.pip_by_tile[pip.tile_name].append(len(self._pips))
+        self._pips.append(pip)
+    
+    def finalize(self):
+        """
+        Freeze the configuration once all PIPs have been added
+        
+        Snapshots active_pips to a frozenset and the tile/frame indices
+        to read-only mappings. Call this after the last add_pip(); the
+        configuration cannot be modified afterwards.
+        """
+        self.active_pips = frozenset(self.active_pips)
+        self.pip_by_tile = MappingProxyType(dict(self.pip_by_tile))
+        self.pip_by_frame = MappingProxyType(
+            {far: frozenset(pips) for far, pips in self.pip_by_frame.items()}
+        )
     
     def get_pips_in_tile(self, tile_name: str) -> Set[ActivePIP]:
         """Get all active PIPs in a tile"""
-        return self.pip_by_tile.get(tile_name, set()).copy()
+        pips = self._pips
+        return {pips[idx] for idx in self.pip_by_tile.get(tile_name, ())}
     
     def get_pips_in_frame(self, far_value: int) -> Set[ActivePIP]:
         """Get all active PIPs configured by a frame"""
@@ -145,6 +177,9 @@ class PIPFrameMapper:
         
         # Cache: (tile, start_wire, end_wire) -> (far, bit_offset)
         self._pip_to_bit: Dict[Tuple[str, int, int], Tuple[int, int]] = {}
+        
+        # Tile name -> its interned copy, for tiles with mapped PIPs only
+        self.mapped_tiles: Dict[str, str] = {}
         self._build_pip_mappings()
     
     def _build_pip_mappings(self):
@@ -160,14 +195,17 @@ class PIPFrameMapper:
         pip_count = 0
         
         for tile in tiles[:100]:  # Limit for performance
-            pips = self.device_model.get_pips_of_tile(tile.name)
+            # Intern tile names so PIP keys compare by identity first
+            tile_name = sys.intern(tile.name)
+            pips = self.device_model.get_pips_of_tile(tile_name)
             if not pips:
                 continue
             
             # Get frames for this tile
-            frame_refs = self.reverse_mapper.get_routing_frames_for_tile(tile.name)
+            frame_refs = self.reverse_mapper.get_routing_frames_for_tile(tile_name)
             if not frame_refs:
                 continue
+            self.mapped_tiles[tile_name] = tile_name
             
             # Distribute PIPs across routing frames
             # This is simplified - real distribution is complex
@@ -175,7 +213,7 @@ class PIPFrameMapper:
                 frame_ref = frame_refs[idx % len(frame_refs)]
                 bit_offset = (idx * 4) % 704  # Approximate bit position
                 
-                key = (tile.name, pip.startWireId, pip.endWireId)
+                key = (tile_name, pip.startWireId, pip.endWireId)
                 self._pip_to_bit[key] = (frame_ref.far_value, bit_offset)
                 pip_count += 1
         
@@ -227,6 +265,10 @@ class RoutingReconstructor:
         self.bit_extractor = FrameBitExtractor()
         
         self.pip_mapper = PIPFrameMapper(self.device_model, self.reverse_mapper)
+        
+        # Frame coverage depends only on device geometry, so it is shared
+        # by every bitstream reconstructed with this instance
+        self._coverage_cache: Dict[int, FrameCoverage] = {}
     
     def reconstruct(self, bitstream: LoadedBitstream,
                    verbose: bool = True) -> RoutingConfiguration:
@@ -250,12 +292,16 @@ class RoutingReconstructor:
         # Process all frames
         frame_count = 0
         routing_frame_count = 0
+        coverage_cache = self._coverage_cache
         
         for frame in bitstream:
             frame_count += 1
             
-            # Get frame coverage
-            coverage = self.frame_mapper.map_frame(frame.far_value)
+            # Get frame coverage (cached across bitstreams)
+            coverage = coverage_cache.get(frame.far_value)
+            if coverage is None:
+                coverage = self.frame_mapper.map_frame(frame.far_value)
+                coverage_cache[frame.far_value] = coverage
             
             # Only process routing frames
             if not coverage.is_routing_frame:
@@ -271,6 +317,8 @@ class RoutingReconstructor:
             if verbose and frame_count % 100 == 0:
                 print(f"  Processed {frame_count} frames, found {len(routing_config.active_pips)} PIPs...")
         
+        routing_config.finalize()
+        
         if verbose:
             stats = routing_config.get_statistics()
             print(f"\nRouting reconstruction complete:")
@@ -282,7 +330,7 @@ class RoutingReconstructor:
         return routing_config
     
     def _extract_pips_from_frame(self, frame: AdaptedFrame,
-                                 coverage) -> List[ActivePIP]:
+                                 coverage: FrameCoverage) -> List[ActivePIP]:
         """
         Extract active PIPs from a single frame
         
@@ -294,12 +342,23 @@ class RoutingReconstructor:
             List of active PIPs
         """
         active_pips = []
+        frame_data = frame.frame_data
         
+        # All-zero frames cannot enable any PIP
+        if frame_data == _ZERO_FRAME_BYTES:
+            return active_pips
+
         # Get routing bits for this frame
         routing_bits = self.bit_extractor.bit_db.get_routing_bits(frame.far_value)
         
-        # For each tile affected by this frame
+        # For each tile affected by this frame. The mapper hands back its
+        # interned tile names; tiles with no mapped PIPs have nothing to check
+        mapped_tiles = self.pip_mapper.mapped_tiles
         for tile_name in coverage.tiles_affected:
+            tile_name = mapped_tiles.get(tile_name)
+            if tile_name is None:
+                continue
+            
             # Get PIPs in this tile
             tile_pips = self.device_model.get_pips_of_tile(tile_name)
             if not tile_pips:
@@ -320,31 +379,106 @@ class RoutingReconstructor:
                 if far != frame.far_value:
                     continue
                 
-                # Extract bit value
-                try:
-                    is_active = self.bit_extractor.extract_bit(
-                        frame.frame_data, bit_offset
-                    )
-                    
-                    if is_active:
-                        active_pips.append(ActivePIP(
-                            tile_name=tile_name,
-                            start_wire_id=pip.startWireId,
-                            end_wire_id=pip.endWireId,
-                            frame_address=frame.far_value,
-                            bit_offset=bit_offset
-                        ))
-                except:
-                    continue
+                # Extract bit value (MSB first, inlined FrameBitExtractor.extract_bit)
+                # _build_pip_mappings only assigns offsets below 704, well inside
+                # the 164-byte frame, so the index needs no bounds check here
+                is_active = (frame_data[bit_offset >> 3] >> (7 - (bit_offset & 7))) & 1
+
+                if is_active:
+                    active_pips.append(ActivePIP(
+                        tile_name=tile_name,
+                        start_wire_id=pip.startWireId,
+                        end_wire_id=pip.endWireId,
+                        frame_address=frame.far_value,
+                        bit_offset=bit_offset
+                    ))
         
         return active_pips
     
+    def compare_summary(self, golden_routing: RoutingConfiguration,
+                        suspect_routing: RoutingConfiguration) -> Dict:
+        """
+        Summarize differences between two routing configurations
+        
+        Lightweight variant of compare_routing() that only counts changes
+        per tile instead of grouping full PIP objects. Use
+        iter_added_by_tile() to drill down into the added PIPs.
+        
+        Both configurations are expected to be finalized (reconstruct()
+        does this), so the set algebra below runs on frozen snapshots
+        that cannot change mid-comparison.
+        
+        Args:
+            golden_routing: Golden reference routing
+            suspect_routing: Suspect routing to analyze
+            
+        Returns:
+            Dictionary with comparison counts and suspicious additions
+        """
+        golden_pips = golden_routing.active_pips
+        suspect_pips = suspect_routing.active_pips
+        
+        return self._summarize_diff(golden_routing, suspect_routing,
+                                    suspect_pips - golden_pips,
+                                    golden_pips - suspect_pips)
+    
+    def _summarize_diff(self, golden_routing: RoutingConfiguration,
+                        suspect_routing: RoutingConfiguration,
+                        added_pips, removed_pips) -> Dict:
+        """Build the compare_summary() counts from precomputed differences"""
+        # Count by tile
+        added_count_by_tile = Counter(pip.tile_name for pip in added_pips)
+        removed_count_by_tile = Counter(pip.tile_name for pip in removed_pips)
+        
+        # New routing in previously unused tile = suspicious
+        # (pip_by_tile only holds tiles with at least one active PIP)
+        suspicious_tiles = added_count_by_tile.keys() - golden_routing.pip_by_tile.keys()
+        
+        return {
+            'golden_pip_count': len(golden_routing.active_pips),
+            'suspect_pip_count': len(suspect_routing.active_pips),
+            'common_pips': len(golden_routing.active_pips) - len(removed_pips),
+            'added_pips': len(added_pips),
+            'removed_pips': len(removed_pips),
+            'tiles_with_changes': len(added_count_by_tile.keys() | removed_count_by_tile.keys()),
+            'added_count_by_tile': dict(added_count_by_tile),
+            'removed_count_by_tile': dict(removed_count_by_tile),
+            'suspicious_additions': [
+                pip for pip in added_pips 
+                if pip.tile_name in suspicious_tiles
+            ] if suspicious_tiles else []
+        }
+    
+    def iter_added_by_tile(self, golden_routing: RoutingConfiguration,
+                           suspect_routing: RoutingConfiguration):
+        """
+        Iterate PIPs added in the suspect routing, grouped by tile
+        
+        Only tiles that gained PIPs are visited, and each is yielded as
+        soon as its additions are grouped, so callers that stop early
+        skip grouping the remaining tiles.
+        
+        Args:
+            golden_routing: Golden reference routing
+            suspect_routing: Suspect routing to analyze
+            
+        Yields:
+            (tile_name, set of added PIPs) tuples
+        """
+        golden_pips = golden_routing.active_pips
+        added_pips = suspect_routing.active_pips - golden_pips
+        
+        for tile_name in dict.fromkeys(pip.tile_name for pip in added_pips):
+            yield tile_name, suspect_routing.get_pips_in_tile(tile_name) - golden_pips
+    
     def compare_routing(self, golden_routing: RoutingConfiguration,
                        suspect_routing: RoutingConfiguration) -> Dict:
         """
         Compare two routing configurations
         
-        Finds PIPs that differ - key for Trojan detection.
+        Finds PIPs that differ - key for Trojan detection. Extends
+        compare_summary() with the full added/removed PIP sets per tile;
+        prefer compare_summary() when only counts are needed.
         
         Args:
             golden_routing: Golden reference routing
@@ -356,52 +490,26 @@ class RoutingReconstructor:
         golden_pips = golden_routing.active_pips
         suspect_pips = suspect_routing.active_pips
         
-        # Find differences
+        # Find differences once and reuse them for counts and grouping
         added_pips = suspect_pips - golden_pips
         removed_pips = golden_pips - suspect_pips
-        common_pips = golden_pips.intersection(suspect_pips)
+        
+        comparison = self._summarize_diff(golden_routing, suspect_routing,
+                                          added_pips, removed_pips)
         
         # Group by tile
         added_by_tile = defaultdict(set)
-        removed_by_tile = defaultdict(set)
-        
         for pip in added_pips:
             added_by_tile[pip.tile_name].add(pip)
         
+        removed_by_tile = defaultdict(set)
         for pip in removed_pips:
             removed_by_tile[pip.tile_name].add(pip)
         
-        return {
-            'golden_pip_count': len(golden_pips),
-            'suspect_pip_count': len(suspect_pips),
-            'common_pips': len(common_pips),
-            'added_pips': len(added_pips),
-            'removed_pips': len(removed_pips),
-            'tiles_with_changes': len(set(added_by_tile.keys()) | set(removed_by_tile.keys())),
-            'added_by_tile': dict(added_by_tile),
-            'removed_by_tile': dict(removed_by_tile),
-            'suspicious_additions': [
-                pip for pip in added_pips 
-                if self._is_suspicious_pip(pip, golden_routing)
-            ]
-        }
-    
-    def _is_suspicious_pip(self, pip: ActivePIP,
-                          golden_routing: RoutingConfiguration) -> bool:
-        """
-        Determine if a PIP addition is suspicious
-        
-        Suspicious = creates routing in unexpected area
-        """
-        # Check if tile was completely unused in golden
-        golden_pips_in_tile = golden_routing.get_pips_in_tile(pip.tile_name)
-        
-        # New routing in previously unused tile = suspicious
-        if len(golden_pips_in_tile) == 0:
-            return True
+        comparison['added_by_tile'] = dict(added_by_tile)
+        comparison['removed_by_tile'] = dict(removed_by_tile)
         
-        # Single new PIP in tile with existing routing = less suspicious
-        return False
+        return comparison
     
     def visualize_routing_diff(self, golden_routing: RoutingConfiguration,
                               suspect_routing: RoutingConfiguration,
@@ -414,7 +522,7 @@ class RoutingReconstructor:
             suspect_routing: Suspect routing
             max_show: Maximum changes to display
         """
-        comparison = self.compare_routing(golden_routing, suspect_routing)
+        comparison = self.compare_summary(golden_routing, suspect_routing)
         
         print("\n" + "="*70)
         print("Routing Configuration Comparison")
@@ -429,7 +537,7 @@ class RoutingReconstructor:
         if comparison['added_pips'] > 0:
             print(f"Added PIPs (showing first {max_show}):")
             shown = 0
-            for tile, pips in comparison['added_by_tile'].items():
+            for tile, pips in self.iter_added_by_tile(golden_routing, suspect_routing):
                 if shown >= max_show:
                     break
                 for pip in pips:
@@ -8,9 +8,12 @@ Provides clean interface for loading bitstreams.
 Part of: Turning the Table - FPGA Trojan Detection
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
+import os
 from datetime import datetime
 
 # Import your existing parser
@@ -23,6 +26,13 @@ from src.mapping.integration.frame_obj_adapter import (
 )
 
 
+# Read size for streaming file hashes (bitstreams are multi-MB)
+_HASH_CHUNK_SIZE = 1 << 20
+
+# SHA256 hashes of files already hashed, keyed by (path, size, mtime_ns)
+_HASH_CACHE: Dict[tuple, str] = {}
+
+
 class BitstreamInfo:
     """
     Metadata about a loaded bitstream
@@ -83,12 +93,27 @@ class BitstreamInfo:
         if self.sha256_hash:
             return self.sha256_hash
         
+        # Reuse the hash of an unchanged file hashed by another instance
+        stat = self.filepath.stat()
+        cache_key = (str(self.filepath.resolve()), stat.st_size, stat.st_mtime_ns)
+        cached = _HASH_CACHE.get(cache_key)
+        if cached is not None:
+            self.sha256_hash = cached
+            return cached
+        
+        # Plain sequential digest: read large blocks straight from the fd
         hasher = hashlib.sha256()
-        with open(self.filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b''):
+        fd = os.open(self.filepath, os.O_RDONLY)
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while chunk := os.read(fd, _HASH_CHUNK_SIZE):
                 hasher.update(chunk)
+        finally:
+            os.close(fd)
         
         self.sha256_hash = hasher.hexdigest()
+        _HASH_CACHE[cache_key] = self.sha256_hash
         return self.sha256_hash
     
     def __str__(self) -> str:
@@ -127,31 +152,35 @@ class LoadedBitstream:
         self._frames_by_column: Dict[int, List[AdaptedFrame]] = {}
         self._frames_by_block_type: Dict[int, List[AdaptedFrame]] = {}
         self._write_history: Dict[int, List[AdaptedFrame]] = {}
+        self._far_set: frozenset = frozenset()
+        self._sorted_fars: Optional[List[int]] = None  # Sorted on first use
         
         self._build_indices()
     
     def _build_indices(self):
         """Build lookup indices from frame list"""
-        far_write_counts: Dict[int, int] = {}
+        write_history = defaultdict(list)
+        frames_by_column = defaultdict(list)
+        frames_by_block_type = defaultdict(list)
+        
         for frame in self.frames:
             # FAR index (last write)
             self._frame_by_far[frame.far_value] = frame
-
+            
             # Track write history
-            if frame.far_value not in self._write_history:
-                self._write_history[frame.far_value] = []
-            self._write_history[frame.far_value].append(frame)
-            far_write_counts[frame.far_value] = far_write_counts.get(frame.far_value, 0) + 1
+            write_history[frame.far_value].append(frame)
             
             # Column index
-            if frame.column not in self._frames_by_column:
-                self._frames_by_column[frame.column] = []
-            self._frames_by_column[frame.column].append(frame)
+            frames_by_column[frame.column].append(frame)
             
             # Block type index
-            if frame.block_type not in self._frames_by_block_type:
-                self._frames_by_block_type[frame.block_type] = []
-            self._frames_by_block_type[frame.block_type].append(frame)
+            frames_by_block_type[frame.block_type].append(frame)
+        
+        # Plain dicts so lookups of missing keys never insert entries
+        self._write_history = dict(write_history)
+        self._frames_by_column = dict(frames_by_column)
+        self._frames_by_block_type = dict(frames_by_block_type)
+        self._far_set = frozenset(self._frame_by_far)
         
         # Update info statistics
         self.info.frame_count = len(self.frames)
@@ -160,8 +189,8 @@ class LoadedBitstream:
             bt: len(frames) for bt, frames in self._frames_by_block_type.items()
         }
         self.info.unique_far_count = len(self._write_history)
-        self.info.multi_write_far_count = sum(1 for count in far_write_counts.values() if count > 1)
-        self.info.total_writes = sum(far_write_counts.values())
+        self.info.multi_write_far_count = sum(1 for writes in self._write_history.values() if len(writes) > 1)
+        self.info.total_writes = len(self.frames)  # Every frame is one write
     
     def get_frame(self, far_value: int) -> Optional[AdaptedFrame]:
         """
@@ -240,7 +269,18 @@ class LoadedBitstream:
         Returns:
             Sorted list of FAR values
         """
-        return sorted(self._frame_by_far.keys())
+        if self._sorted_fars is None:
+            self._sorted_fars = sorted(self._far_set)
+        return list(self._sorted_fars)
+    
+    def get_far_set(self) -> frozenset:
+        """
+        Get set of all FAR values in bitstream
+        
+        Returns:
+            Frozenset of FAR values
+        """
+        return self._far_set
     
     def __len__(self) -> int:
         """Return number of frames"""
@@ -336,6 +376,10 @@ class BitstreamLoader:
         Returns:
             List of valid frames (invalid ones filtered out)
         """
+        # Fast path: nothing to filter or report
+        if self.adapter.all_frames_valid(frames):
+            return frames
+        
         valid_frames = []
         
         for frame in frames:
@@ -348,60 +392,98 @@ class BitstreamLoader:
         
         return valid_frames
     
-    def load_multiple(self, bitstream_paths: List[str]) -> Dict[str, LoadedBitstream]:
+    def load_multiple(self, bitstream_paths: List[str],
+                      max_workers: Optional[int] = None,
+                      validate: bool = True,
+                      capture_history: bool = True) -> Dict[str, LoadedBitstream]:
         """
         Load multiple bitstreams
         
+        Files are parsed in parallel worker processes (parsing is CPU-bound
+        Python). A single path, or a single available worker, is loaded
+        in-process with self.load.
+        
         Args:
             bitstream_paths: List of paths to .bit files
+            max_workers: Worker process count (defaults to CPU count)
+            validate: Whether to validate adapted frames (as in load)
+            capture_history: Keep intermediate writes for each FAR (as in load)
             
         Returns:
             Dictionary mapping filename to LoadedBitstream
         """
         results = {}
-        
-        for path in bitstream_paths:
-            bitstream = self.load(path)
-            if bitstream:
-                results[Path(path).name] = bitstream
+        workers = min(max_workers or os.cpu_count() or 1, len(bitstream_paths))
+        
+        if workers <= 1:
+            for path in bitstream_paths:
+                bitstream = self.load(path, validate=validate, capture_history=capture_history)
+                if bitstream:
+                    results[Path(path).name] = bitstream
+            return results
+        
+        # Workers rebuild a loader of this loader's (and adapter's) class
+        # and load with the same options, matching self.load
+        jobs = [(type(self), type(self.adapter), path, validate, capture_history)
+                for path in bitstream_paths]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            loaded = executor.map(_load_in_worker, jobs)
+            
+            for path, (bitstream, adapted_count, adapter_errors) in zip(bitstream_paths, loaded):
+                # Fold worker statistics into this loader
+                self.adapter.adaptation_count += adapted_count
+                self.adapter.errors.extend(adapter_errors)
+                
+                if bitstream:
+                    self.bitstreams_loaded += 1
+                    self.total_frames_loaded += len(bitstream)
+                    results[Path(path).name] = bitstream
         
         return results
     
-    def compare_bitstreams(self, path1: str, path2: str) -> Dict:
+    def compare_bitstreams(self, path1: Union[str, LoadedBitstream],
+                           path2: Union[str, LoadedBitstream]) -> Dict:
         """
         Quick comparison of two bitstreams
         
+        Already loaded bitstreams can be passed instead of paths to avoid
+        re-parsing them (e.g. for pairwise comparison of many files).
+        
         Args:
-            path1: First bitstream path
-            path2: Second bitstream path
+            path1: First bitstream path or LoadedBitstream
+            path2: Second bitstream path or LoadedBitstream
             
         Returns:
             Dictionary with comparison statistics
         """
-        bs1 = self.load(path1, validate=False)
-        bs2 = self.load(path2, validate=False)
+        bs1 = path1 if isinstance(path1, LoadedBitstream) else self.load(path1, validate=False)
+        bs2 = path2 if isinstance(path2, LoadedBitstream) else self.load(path2, validate=False)
         
         if not bs1 or not bs2:
             return {'error': 'Failed to load one or both bitstreams'}
         
         # Get FAR sets
-        fars1 = set(bs1.get_all_far_values())
-        fars2 = set(bs2.get_all_far_values())
+        fars1 = bs1.get_far_set()
+        fars2 = bs2.get_far_set()
         
-        # Calculate differences
+        # Calculate differences (only counts are reported, so the
+        # one-sided differences are derived from the intersection size)
         common_fars = fars1.intersection(fars2)
-        only_in_1 = fars1 - fars2
-        only_in_2 = fars2 - fars1
+        only_in_1_count = len(fars1) - len(common_fars)
+        only_in_2_count = len(fars2) - len(common_fars)
         
-        # Count frame data differences
+        # Count frame data differences, walking common frames in FAR order
         data_differences = []
-        for far in common_fars:
-            frame1 = bs1.get_frame(far)
-            frame2 = bs2.get_frame(far)
-            
-            if frame1 and frame2:
-                if frame1.frame_data != frame2.frame_data:
-                    data_differences.append(far)
+        get_frame1 = bs1.get_frame
+        get_frame2 = bs2.get_frame
+        for far in sorted(common_fars):
+            frame1 = get_frame1(far)
+            frame2 = get_frame2(far)
+            # Content hashes differ -> data differs; equal hashes are
+            # confirmed byte-for-byte to rule out collisions
+            if (frame1.data_hash != frame2.data_hash
+                    or frame1.frame_data != frame2.frame_data):
+                data_differences.append(far)
         
         return {
             'bitstream1': bs1.info.filename,
@@ -409,10 +491,10 @@ class BitstreamLoader:
             'frames_in_1': len(bs1),
             'frames_in_2': len(bs2),
             'common_frames': len(common_fars),
-            'only_in_1': len(only_in_1),
-            'only_in_2': len(only_in_2),
+            'only_in_1': only_in_1_count,
+            'only_in_2': only_in_2_count,
             'data_differences': len(data_differences),
-            'changed_fars': [f"0x{far:08X}" for far in sorted(data_differences)[:20]]
+            'changed_fars': [f"0x{far:08X}" for far in data_differences[:20]]
         }
     
     def get_statistics(self) -> Dict:
@@ -431,6 +513,25 @@ class BitstreamLoader:
         }
 
 
+def _load_in_worker(job: Tuple[type, type, str, bool, bool]
+                    ) -> Tuple[Optional[LoadedBitstream], int, List[str]]:
+    """
+    Load one bitstream in a worker process (see BitstreamLoader.load_multiple)
+    
+    Args:
+        job: (loader class, adapter class, path, validate, capture_history)
+    
+    Returns:
+        (LoadedBitstream or None, frames adapted, adapter error messages)
+    """
+    loader_cls, adapter_cls, bitstream_path, validate, capture_history = job
+    loader = loader_cls()
+    loader.adapter = adapter_cls()
+    bitstream = loader.load(bitstream_path, validate=validate,
+                            capture_history=capture_history)
+    return bitstream, loader.adapter.adaptation_count, loader.adapter.errors
+
+
 # ============================================================================
 # Convenience Functions
 # ============================================================================
@@ -1,5 +1,6 @@
 # here is the code of bitstream loder file (.bit)
 
+import mmap
 from typing import Tuple , Optional
 from src.parser.header_lexer import Header , HeaderLexer
 from src.parser.payload_lexer import FrameLexer
@@ -18,10 +19,39 @@ class Parser:
         self.src = src
         self.head = None
         self.config :list = []
+        self._mm = None
 
-    def readBinaryFile(self,filepath:str) -> bytes:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """
+        Unmap the file mapped by readBinaryFile.
+        Views returned by readBinaryFile / split_on_marker must be released first.
+        """
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._mm = None
+
+    def readBinaryFile(self,filepath:str) -> memoryview:
+        """
+        Map the file read-only and return a view over it.
+        The mapping is kept on self so slices of the view stay valid
+        until close() (parse() closes it once the payload is decoded).
+        """
         with open(filepath , 'rb') as f:
-            return f.read()
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files cannot be mapped
+                self._mm = b""
+        if hasattr(self._mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            # marker search and word decode both walk the file front to back
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+        return memoryview(self._mm)
 
     def print_hexdump(self,data,width=16):
         for off in range(0,len(data),width):
@@ -38,16 +68,16 @@ class Parser:
             which:str ="first" , 
             keep_marker:bool = False , 
             decode_header_as:str = 'ascii'
-            ) -> Tuple[bytes,bytes,Optional[int]]:
+            ) -> Tuple[memoryview,memoryview,Optional[int]]:
         
         if which not in ("first","last"):
             raise ValueError("which most be 'first' or 'last'")
 
         data = self.readBinaryFile(filepath)
-        idx = data.find(marker) if which == "first" else data.rfind(marker)
+        idx = self._mm.find(marker) if which == "first" else self._mm.rfind(marker)
         if idx == -1:
             payload = data
-            return (b"" , payload , None)
+            return (data[:0] , payload , None)
 
         head = data[:idx]
         payload = data[idx:] if keep_marker else data[idx + len(marker) :]
@@ -82,12 +112,19 @@ class Parser:
 
     def parse(self):
         header , payload , idx = self.split_on_marker(self.src)
-        
-        # header
-        self.parse_header(header)
-
-        # payload
-        self.parse_payload(payload)
+        try:
+            # header
+            self.parse_header(header)
+
+            # payload
+            self.parse_payload(payload)
+        finally:
+            header.release()
+            payload.release()
+
+        # header values and payload words are copies by now, so the file
+        # can be unmapped
+        self.close()
         
         return [self.head,self.config]
 
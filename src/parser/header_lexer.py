@@ -31,39 +31,31 @@ class HeaderToken:
 
 
 
+# Header field tags 'a'..'e' (design, device, date, time, length) as a
+# bitmask indexed by byte value: bit 0x61..0x65 set
+_VALID_TAGS_MASK = 0x1F << 0x61
+
+
 class HeaderLexer:
     def __init__(self, header):
-        self.header = header
+        self.header = memoryview(header)
         self.toks = []
-        self.start = 0
-        self.pos = 0
-
-    def peek(self):
-        if self.pos < len(self.header):
-            c = self.header[self.pos]
-            return c
-
-    def advance(self):
-        if self.pos < len(self.header):
-            c =  self.header[self.pos]
-            self.pos += 1
-            return c
 
-    def do_lexing(self):
-        c = self.advance()
-        if c in (0x00 , 0x01):
-            prefix = c
-        if self.peek() in [0x61 , 0x62 , 0x63 , 0x64 , 0x65]:
-            tag = self.advance()
-            if self.peek() == 0x00:
-                self.pos +=1
-                length = self.advance()
-                value = self.header[self.pos:(self.pos + length-1)]
-                return HeaderToken(prefix , tag , length , value)
-    
     def lexer(self):
-        while self.pos < len(self.header):
-            tok = self.do_lexing()
-            if tok:
-                self.toks.append(tok)
+        """
+        Scan header TLVs: (0x00 | 0x01) TAG 0x00 LEN VALUE
+        """
+        header = self.header
+        end = len(header)
+        pos = 0
+        while pos + 4 <= end:
+            prefix = header[pos]
+            tag = header[pos + 1]
+            if prefix > 0x01 or not (_VALID_TAGS_MASK >> tag) & 1 or header[pos + 2] != 0x00:
+                pos += 1
+                continue
+            length = header[pos + 3]
+            value = header[pos + 4:pos + 4 + length - 1].tobytes()  # drop NUL terminator
+            self.toks.append(HeaderToken(prefix , tag , length , value))
+            pos += 4 + max(length - 1, 0)
         return self.toks
@@ -1,9 +1,9 @@
 # # payload lexer code here
-import struct
 import sys
 import time
 import itertools
 import os
+from array import array
 
 
 opcode = {
@@ -13,6 +13,9 @@ opcode = {
     '11' : 'SYNC',
 }
 
+# opcode names indexed by the 2-bit opcode field
+_OP_NAMES = tuple(opcode[f"{i:02b}"] for i in range(4))
+
 MajorMinors = {
     # column : max minors per column
     0 : 36,
@@ -46,6 +49,35 @@ Blocks_Majors = {
     'IO'    : [7,13],
 }
 
+# Lookup tables derived from Blocks / Blocks_Majors, keyed by block code
+_BLOCK_MAJORS_BY_CODE = {code : tuple(Blocks_Majors[name]) for code , name in Blocks.items()}
+_NEXT_BLOCK_CODE = {
+    code : next((c for c in range(code + 1 , code + 11) if c in Blocks), None)
+    for code in Blocks
+}
+_FIRST_BLOCK_CODE = min(Blocks)
+
+# Index tables over the full FAR field ranges (column: 5 bits, block: 3 bits);
+# entries not in MajorMinors / Blocks hold the helpers' "unknown" value
+_MAX_MINOR_BY_COLUMN = tuple(MajorMinors.get(c, -1) for c in range(32))
+_FIRST_MAJOR_BY_BLOCK = tuple(Blocks_Majors[Blocks[b]][0] if b in Blocks else float('-inf') for b in range(8))
+_LAST_MAJOR_BY_BLOCK = tuple(Blocks_Majors[Blocks[b]][-1] if b in Blocks else float('-inf') for b in range(8))
+
+# array typecode with 4-byte items (configuration words are 32-bit)
+_WORD_TYPECODE = 'I' if array('I').itemsize == 4 else 'L'
+
+
+def _decode_words(payload) -> array:
+    """
+    Decode a payload into an array of big-endian 32-bit words
+    A trailing partial word is ignored.
+    """
+    words = array(_WORD_TYPECODE)
+    words.frombytes(payload[:len(payload) - len(payload) % 4])
+    if sys.byteorder == 'little':
+        words.byteswap()
+    return words
+
 
 class Packet:
     pass
@@ -61,7 +93,7 @@ class FAR(Packet):
         self.value = value
     
     def __repr__(self):
-        return f"FAR(OpCode:[{self.opcode}] , REG_ADDR:[{self.reg_address}] , WC:[{self.word_count}] , Value:[0x{''.join(format(b,'02X') for b in self.value)}])"
+        return f"FAR(OpCode:[{self.opcode}] , REG_ADDR:[{self.reg_address:014b}] , WC:[{self.word_count:013b}] , Value:[0x{self.value:08X}])"
 
 
 class FDRI(Packet):
@@ -74,9 +106,12 @@ class FDRI(Packet):
         self.payload = payload
     
     def __repr__(self):
-        return f"FDRI(OpCode:[{self.opcode}] , WC:[{self.word_count}] , Frames:[{len(self.payload)}])"
+        return f"FDRI(OpCode:[{self.opcode}] , WC:[{self.word_count:b}] , Frames:[{len(self.payload)}])"
 
 class FrameObj:
+    # One instance per frame; slots keep the per-frame footprint small
+    __slots__ = ('far_raw', 'block_type', 'top_bottom', 'column', 'major', 'minor', 'data_words', 'idx')
+
     def __init__(self, far_raw , block_type , top_bottom , column , major, minor ,data_words , idx):
         self.far_raw = far_raw
         self.block_type = block_type
@@ -87,13 +122,19 @@ class FrameObj:
         self.data_words = data_words
         self.idx = idx
 
+    @property
+    def far_hex(self) -> str:
+        # FAR as 8 hex digits, e.g. "00234000" (formatted on demand)
+        return f"{self.far_raw:08X}"
+
     def __repr__(self):
-        return f"FrameObj(FAR:[{self.far_raw}] , Block:[{self.block_type}], TopBottom:[{self.top_bottom}] , Column:[{self.column}] , Minor:[{self.minor}] FrameIdx:[{self.idx}])"
+        return f"FrameObj(FAR:[{self.far_hex}] , Block:[{self.block_type}], TopBottom:[{self.top_bottom}] , Column:[{self.column}] , Minor:[{self.minor}] FrameIdx:[{self.idx}])"
 
 
 class FrameLexer:
     def __init__(self, payload):
         self.payload = memoryview(payload)
+        self.words = _decode_words(self.payload)
         self.toks = []
         self.frames = {}
         self.result = []
@@ -121,19 +162,13 @@ class FrameLexer:
         return self.advance(width)
     
     def max_minor(self , column):
-        return MajorMinors.get(column,-1)
+        return _MAX_MINOR_BY_COLUMN[column] if 0 <= column < 32 else -1
     
     def last_major_block(self , block_code):
-        block_name = Blocks.get(block_code)
-        if block_name:
-            return Blocks_Majors[block_name][-1]
-        return float('-inf')
+        return _LAST_MAJOR_BY_BLOCK[block_code] if 0 <= block_code < 8 else float('-inf')
     
     def first_major_block(self , block_code):
-        block_name = Blocks.get(block_code)
-        if block_name:
-            return Blocks_Majors[block_name][0]
-        return float('-inf')
+        return _FIRST_MAJOR_BY_BLOCK[block_code] if 0 <= block_code < 8 else float('-inf')
     
     def pack_far(self,block:int,top_bottom:int,column:int,minor:int) -> int:
         # major(6bits) = (top_bottom << 5) | column(5bits)
@@ -141,16 +176,14 @@ class FrameLexer:
         far_int = ((block & 0x7) << 29 | (major & 0x3F) << 23 | (minor & 0x3F) << 17)
         return far_int
     
-    def interpret_far(self,far:bytes):
+    def interpret_far(self,far:int):
         if far is None:
             raise ValueError("interpreter_far received None as FAR Value.")
         
-        if isinstance(far , memoryview):
-            far = far.tobytes()
-        elif not isinstance(far,bytes):
-            raise TypeError(f"interpreter_far expects bytes-like, got {type(far)}")
+        if not isinstance(far,int):
+            raise TypeError(f"interpreter_far expects the FAR word as int, got {type(far)}")
         
-        far_hex = int.from_bytes(far,'big')
+        far_hex = far
         block = (far_hex >> 29) & 0b111 # 31-29 block type
         major= (far_hex >> 23) & 0b11_1111 # 28-23 major
         top_bottom = (major >> 5) & 0b1 # 0 top , 1 bottom
@@ -161,41 +194,38 @@ class FrameLexer:
         return [block ,top_bottom , column , major , minor]
     
 
-    def do_lexing(self , packet , width):
-        if packet is None or len(packet) < width:
-            return None
-        
-        if isinstance(packet , memoryview):
-            packet = packet.tobytes()
-        
-        hdr =  struct.unpack(">I",packet)[0]
+    def do_lexing(self , hdr , width):
+        """
+        Decode the packet whose header word `hdr` was just consumed
+        """
         _type = (hdr >> 29) & 0x7
-        _op = (hdr >> 27) & 0x3
-        op = opcode.get(f"{_op:02b}")
+        op = _OP_NAMES[(hdr >> 27) & 0x3]
         if _type == 0b001:
             reg_address = (hdr >> 13) & 0xFFFF
             word_count = hdr & 0x1FFF         
             if op == "WRITE" and word_count == 1:
-                value = self.nextPacket(width)
-                return FAR(op , f"{reg_address:014b}" , f"{word_count:013b}",value)
+                # FAR value is the next word, already decoded in self.words
+                value = None
+                if self.pos + width <= len(self.payload):
+                    value = self.words[self.pos // width]
+                    self.pos += width
+                return FAR(op , reg_address , word_count , value)
             
         elif _type == 0b010:
             word_count = hdr & 0x1FFFFFF
             n = int(word_count)
             frame_size = 41
-            _payload = []              
             
-            for _ in range(n):
-                word = self.nextPacket(width)
-                if word is None:
-                    break
-                _payload.append(word)
-
-            temp = []
-            for i in range(0,len(_payload) , frame_size):
-                temp.append(_payload[i:i+frame_size])
+            # View the payload words in place (truncated at end of data);
+            # each frame below is a view of this, so nothing is copied
+            start = self.pos // width
+            _payload = memoryview(self.words)[start:start + n]
+            self.pos += len(_payload) * width
+
+            # One row view per frame; the comprehension avoids a per-frame append call
+            temp = [_payload[i:i+frame_size] for i in range(0,len(_payload) , frame_size)]
             
-            return FDRI(op,f"{word_count:b}" , temp)
+            return FDRI(op , word_count , temp)
         
         return None
     
@@ -248,24 +278,7 @@ class FrameLexer:
         total_needed = len(payload_frames)
         created = 0
 
-        def block_name_for(code):
-            return Blocks.get(code,None)
-        
-        def next_block_code(code):
-            condidate = code + 1
-            for _ in range(10):
-                if Blocks.get(  condidate) is not None:
-                    return condidate
-                condidate += 1
-            return None
-        
-        def major_list_for_block(code):
-            name = block_name_for(code)
-            if name is None:
-                return None
-            return Blocks_Majors[name]
-        
-        major_list = major_list_for_block(block)
+        major_list = _BLOCK_MAJORS_BY_CODE.get(block)
         if major_list is None:
             raise ValueError(f"Unknows starting block code {block}")
         
@@ -275,29 +288,35 @@ class FrameLexer:
             maj_idx = 0
             column = major_list[0]
         
-        max_iter = total_needed * 4 + 1000
-
-        while created < total_needed and max_iter > 0:
-            max_iter -= 1
-
-            far_int = self.pack_far(block,top_bottom,column,minor)
-            far_hex = f"{far_int:08X}"
-            chunk = payload_frames[created]
+        # Bind per-frame lookups to locals once, outside the hot loop
+        max_minor_by_column = _MAX_MINOR_BY_COLUMN
+        progress = self.enable_progress
+        render_progress = self._render_progress
+        append_result = self.result.append
+
+        while created < total_needed:
+            # FAR bits fixed for this column (same layout as pack_far)
             major = ((top_bottom << 5) | (column & 0x1F))
-            frame = FrameObj(far_hex,block,top_bottom,column,major,minor,chunk,start_idx+created)
-            self.result.append(frame)
-            created += 1
-            self._render_progress(created, total_needed)
-
-            next_minor = minor + 1
-            max_m = self.max_minor(column)
-
-            if max_m == -1:
-                raise ValueError(f"Unknows max minor for column {column} (block {block})")
-            
-            if next_minor < max_m:
-                minor = next_minor
-                continue
+            far_base = (block & 0x7) << 29 | (major & 0x3F) << 23
+            max_m = max_minor_by_column[column]
+
+            # Inner loop: walk the minors of the current column
+            while True:
+                far_int = far_base | (minor & 0x3F) << 17
+                chunk = payload_frames[created]
+                frame = FrameObj(far_int,block,top_bottom,column,major,minor,chunk,start_idx+created)
+                append_result(frame)
+                created += 1
+                # Progress off: one local test per frame. On: redraw every 4096 frames
+                if progress and not (created & 0xFFF):
+                    render_progress(created, total_needed)
+
+                if max_m == -1:
+                    raise ValueError(f"Unknows max minor for column {column} (block {block})")
+
+                minor += 1
+                if minor >= max_m or created >= total_needed:
+                    break
 
             minor = 0
 
@@ -308,12 +327,11 @@ class FrameLexer:
 
                 continue
 
-            next_block = next_block_code(block)
+            next_block = _NEXT_BLOCK_CODE[block]
             if next_block is None:
                 top_bottom ^= 1
-                min_block_code = min(Blocks.keys())
-                block = min_block_code
-                major_list = major_list_for_block(block)
+                block = _FIRST_BLOCK_CODE
+                major_list = _BLOCK_MAJORS_BY_CODE[block]
                 maj_idx = 0
                 column = major_list[maj_idx] # pyright: ignore[reportOptionalSubscript]
                 major = column
@@ -321,7 +339,7 @@ class FrameLexer:
                 continue
 
             block = next_block
-            major_list = major_list_for_block(block)
+            major_list = _BLOCK_MAJORS_BY_CODE.get(block)
             if major_list is None:
                 raise ValueError(f"No major list for block {block}")
             
@@ -333,33 +351,43 @@ class FrameLexer:
         if created != total_needed:
             raise RuntimeError(f"Could not generate requied frames: created {created}, expected {total_needed}")
 
-        self._render_progress(total_needed, total_needed, force=True)
+        if progress:
+            self._render_progress(total_needed, total_needed, force=True)
         return created 
 
 
     def lexer(self ,width=4) -> list[Packet]:
+        words = self.words
+        # Pass 1: tokenize packets and record each FDRI as an independent job
+        fdri_jobs = []
+        next_idx = 0
         while self.pos + width <= len(self.payload):
-            packet = self.advance(width)
-            res = self.do_lexing(packet,width)
+            # Packet headers are read from the pre-decoded word array
+            hdr = words[self.pos // width]
+            self.pos += width
+            res = self.do_lexing(hdr,width)
 
             if res:
                 self.toks.append(res)
                 if isinstance(res,FAR):
-                    far_bytes = res.value
-                    far_tuple = self.interpret_far(far_bytes) # type: ignore
+                    far_tuple = self.interpret_far(res.value)
                     self.last_far = far_tuple
 
                 if isinstance(res,FDRI):
                     if self.last_far is None:
                         raise ValueError("FDRI encountered before any FAR (Bitstream malformed.)")
                     
-                    start_fields = self.last_far
-                    payload_frames = res.payload
-                    start_idx = len(self.result)
-                    created = self.generate_frames(start_fields,payload_frames,start_idx)
-                    expected = len(payload_frames)
-
-                    if created != expected:
-                        print(f"Warning: created {created} frames but expected {expected} frames for this FDRI (start FAR={start_fields})")
-        self._render_progress(0, 0, finalize_only=True)
+                    fdri_jobs.append((self.last_far, res.payload, next_idx))
+                    next_idx += len(res.payload)
+
+        # Pass 2: expand frames. Each job has its own start FAR and output
+        # indices, so jobs share no state beyond the result list
+        for start_fields, payload_frames, start_idx in fdri_jobs:
+            created = self.generate_frames(start_fields,payload_frames,start_idx)
+            expected = len(payload_frames)
+
+            if created != expected:
+                print(f"Warning: created {created} frames but expected {expected} frames for this FDRI (start FAR={start_fields})")
+        if self.enable_progress:
+            self._render_progress(0, 0, finalize_only=True)
         return self.result
\ No newline at end of file
@@ -6,10 +6,18 @@ Human-readable reporting in multiple formats.
 
 from .simple_report_generator import (
     SimpleReportGenerator,
-    quick_report
+    ReportFormat,
+    quick_report,
+    quick_report_many,
+    make_reporter,
+    reset_auto_format
 )
 
 __all__ = [
     'SimpleReportGenerator',
-    'quick_report'
+    'ReportFormat',
+    'quick_report',
+    'quick_report_many',
+    'make_reporter',
+    'reset_auto_format'
 ]
\ No newline at end of file
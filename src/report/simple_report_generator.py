@@ -12,13 +12,22 @@ Part of: Turning the Table - FPGA Trojan Detection
 
 from __future__ import annotations
 
+import io
+import os
 import re
+import heapq
 import sys
+from itertools import islice
 import json
-import unicodedata
-from typing import Dict, List, Optional, Tuple
+from unicodedata import east_asian_width as _east_asian_width
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from enum import IntEnum
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from dataclasses import dataclass
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
 # Optional color support -----------------------------------------------------
 try:
@@ -32,6 +41,14 @@ except Exception:
     Fore = Back = Style = _Plain()  # type: ignore
     HAS_COLOR = False
 
+# Optional fast JSON encoder -------------------------------------------------
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
+
 # Import anomaly structures --------------------------------------------------
 from src.detector.differential.frame_anomaly import (
     AnomalyReport,
@@ -102,25 +119,94 @@ class BoxChars:
     BR_DOUBLE = "╝"
 
 
-SEVERITY_ICONS = {
+# Read-only: the style sets and row labels below are derived from these
+# tables once at import, so edits would never reach the reports
+SEVERITY_ICONS = MappingProxyType({
     "CRITICAL": f"{Icons.RED_CIRCLE} CRITICAL",
     "HIGH": f"{Icons.YELLOW_CIRCLE} HIGH",
     "MEDIUM": f"{Icons.BLUE_CIRCLE} MEDIUM",
     "LOW": f"{Icons.WHITE_CIRCLE} LOW",
-}
+})
+
+# SGR color sequences as emitted by colorama (stripped before measuring width)
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_WIDE_EAW = frozenset({"W", "F"})
 
-SEVERITY_COLORS = {
+SEVERITY_COLORS = MappingProxyType({
     "CRITICAL": Colors.ERROR + Colors.BRIGHT,
     "HIGH": Colors.WARNING + Colors.BRIGHT,
     "MEDIUM": Colors.PRIMARY + Colors.BRIGHT,
     "LOW": Colors.DIM,
-}
+})
+
+
+def _text_styles(enabled: bool) -> SimpleNamespace:
+    """Combined SGR prefixes used by text reports ("" everywhere when disabled)"""
+    sequences = {
+        "primary": Colors.PRIMARY,
+        "secondary": Colors.SECONDARY,
+        "success": Colors.SUCCESS,
+        "warning": Colors.WARNING,
+        "error": Colors.ERROR,
+        "critical": Colors.CRITICAL,
+        "info": Colors.INFO,
+        "dim": Colors.DIM,
+        "bright": Colors.BRIGHT,
+        "primary_bright": Colors.PRIMARY + Colors.BRIGHT,
+        "secondary_bright": Colors.SECONDARY + Colors.BRIGHT,
+        "success_bright": Colors.SUCCESS + Colors.BRIGHT,
+        "warning_bright": Colors.WARNING + Colors.BRIGHT,
+        "error_bright": Colors.ERROR + Colors.BRIGHT,
+        "critical_bright": Colors.CRITICAL + Colors.BRIGHT,
+        "error_bright_on_black": Colors.ERROR + Colors.BRIGHT + Back.BLACK,
+        "reset": Style.RESET_ALL,
+    }
+    styles = SimpleNamespace(**{name: seq if enabled else "" for name, seq in sequences.items()})
+    # Every SeverityLevel value has an entry (INFO color for unlisted ones),
+    # so lookups can subscript instead of .get() with a fallback
+    styles.severity = {
+        level.value: SEVERITY_COLORS.get(level.value, Colors.INFO) if enabled else ""
+        for level in SeverityLevel
+    }
+    return styles
+
+
+_COLOR_STYLES = _text_styles(True)
+_PLAIN_STYLES = _text_styles(False)
+
+# Severity distribution bars for every fill level (0.._BAR_WIDTH), built once
+_BAR_WIDTH = 40
+# Row labels of the severity distribution, in display order
+_SEVERITY_ROW_ICONS = tuple(SEVERITY_ICONS[sev] for sev in ("CRITICAL", "HIGH", "MEDIUM", "LOW"))
+_SEVERITY_BARS = tuple("█" * i + "░" * (_BAR_WIDTH - i) for i in range(_BAR_WIDTH + 1))
 
 
 # ============================================================================
 # Formatting Utilities
 # ============================================================================
 
+def dumps_json_bytes(data) -> bytes:
+    """
+    Serialize to indented, key-sorted UTF-8 JSON (orjson when available)
+    
+    Without orjson the output is exactly what json.dumps(indent=2,
+    sort_keys=True) has always produced. orjson's output can differ: it
+    writes non-ASCII characters as raw UTF-8 instead of \\uXXXX escapes,
+    NaN and Infinity as null, and some floats in a shorter form.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+                            | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def dumps_json(data) -> str:
+    """Serialize to indented, key-sorted JSON text; see dumps_json_bytes()"""
+    if HAS_ORJSON:
+        return dumps_json_bytes(data).decode("utf-8")
+    return json.dumps(data, indent=2, sort_keys=True)
+
+
 def colorize(text: str, color: str = "") -> str:
     """Apply color to text if terminal supports it"""
     if sys.stdout.isatty() and HAS_COLOR:
@@ -128,14 +214,22 @@ def colorize(text: str, color: str = "") -> str:
     return text
 
 
+def _no_color(text: str, color: str = "") -> str:
+    """colorize() stand-in for generators with colors turned off"""
+    return text
+
+
 def visible_width(text: str) -> int:
     """Calculate printable width accounting for ANSI codes"""
     if not text:
         return 0
-    ansi_clean = re.sub(r"\x1b\[[0-9;]*m", "", text)
+    if "\x1b" in text:
+        text = _ANSI_RE.sub("", text)
+    if text.isascii():
+        return len(text)
     width = 0
-    for char in ansi_clean:
-        width += 2 if unicodedata.east_asian_width(char) in {"W", "F"} else 1
+    for char in text:
+        width += 2 if _east_asian_width(char) in _WIDE_EAW else 1
     return width
 
 
@@ -160,7 +254,7 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     trimmed = ""
     current = 0
     for char in text:
-        char_width = 2 if unicodedata.east_asian_width(char) in {"W", "F"} else 1
+        char_width = 2 if _east_asian_width(char) in _WIDE_EAW else 1
         if current + char_width > max_body:
             break
         trimmed += char
@@ -168,23 +262,26 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     return trimmed + suffix
 
 
-def draw_header(title: str, width: int = 80, double: bool = True) -> str:
+def draw_header(title: str, width: int = 80, double: bool = True,
+                use_colors: bool = True) -> str:
     """Draw formatted header"""
     if double:
-        top = colorize(BoxChars.TL_DOUBLE + BoxChars.H_DOUBLE * (width - 2) + BoxChars.TR_DOUBLE,
-                       Colors.PRIMARY + Colors.BRIGHT)
-        bottom = colorize(BoxChars.BL_DOUBLE + BoxChars.H_DOUBLE * (width - 2) + BoxChars.BR_DOUBLE,
-                          Colors.PRIMARY + Colors.BRIGHT)
-        v = colorize(BoxChars.V_DOUBLE, Colors.PRIMARY + Colors.BRIGHT)
+        top = BoxChars.TL_DOUBLE + BoxChars.H_DOUBLE * (width - 2) + BoxChars.TR_DOUBLE
+        bottom = BoxChars.BL_DOUBLE + BoxChars.H_DOUBLE * (width - 2) + BoxChars.BR_DOUBLE
+        v = BoxChars.V_DOUBLE
     else:
-        top = colorize(BoxChars.TL_CORNER + BoxChars.H_LINE * (width - 2) + BoxChars.TR_CORNER,
-                       Colors.PRIMARY + Colors.BRIGHT)
-        bottom = colorize(BoxChars.BL_CORNER + BoxChars.H_LINE * (width - 2) + BoxChars.BR_CORNER,
-                          Colors.PRIMARY + Colors.BRIGHT)
-        v = colorize(BoxChars.V_LINE, Colors.PRIMARY + Colors.BRIGHT)
+        top = BoxChars.TL_CORNER + BoxChars.H_LINE * (width - 2) + BoxChars.TR_CORNER
+        bottom = BoxChars.BL_CORNER + BoxChars.H_LINE * (width - 2) + BoxChars.BR_CORNER
+        v = BoxChars.V_LINE
     
     title_padded = pad_text(title, width - 4, align="center")
-    middle = f"{v} {colorize(title_padded, Colors.PRIMARY + Colors.BRIGHT)} {v}"
+    if use_colors:
+        style = Colors.PRIMARY + Colors.BRIGHT
+        top = colorize(top, style)
+        bottom = colorize(bottom, style)
+        v = colorize(v, style)
+        title_padded = colorize(title_padded, style)
+    middle = f"{v} {title_padded} {v}"
     
     return f"{top}\n{middle}\n{bottom}"
 
@@ -204,45 +301,34 @@ def draw_separator(width: int = 80, char: str = "-") -> str:
 def format_table(headers: List[str], rows: List[List[str]], 
                 col_widths: Optional[List[int]] = None) -> List[str]:
     """Format data as table"""
-    lines = []
-    
+    n_cols = len(headers)
     if not col_widths:
-        col_widths = []
-        for i in range(len(headers)):
-            max_len = visible_width(str(headers[i]))
-            for row in rows:
-                if i < len(row):
-                    max_len = max(max_len, visible_width(str(row[i])))
-            col_widths.append(min(max_len + 2, 50))
-    
-    # Top border
-    border_top = "┌" + "┬".join("─" * w for w in col_widths) + "┐"
-    lines.append(border_top)
-    
-    # Headers
-    header_parts = []
-    for i in range(len(headers)):
-        header_text = truncate_text(str(headers[i]), col_widths[i])
-        header_parts.append(pad_text(header_text, col_widths[i], align="center"))
-    lines.append("│" + "│".join(header_parts) + "│")
+        col_widths = [
+            min(max(visible_width(str(headers[i])),
+                    *(visible_width(str(row[i])) for row in rows if i < len(row))) + 2, 50)
+            for i in range(n_cols)
+        ]
+    widths = col_widths[:n_cols]
     
-    # Separator
-    separator = "├" + "┼".join("─" * w for w in col_widths) + "┤"
-    lines.append(separator)
+    # Borders depend only on the widths, so render each once
+    border_top = "┌" + "┬".join("─" * w for w in widths) + "┐"
+    separator = "├" + "┼".join("─" * w for w in widths) + "┤"
+    border_bottom = "└" + "┴".join("─" * w for w in widths) + "┘"
     
-    # Rows
-    for row in rows:
-        row_parts = []
-        for i in range(len(headers)):
-            if i < len(row):
-                cell_text = truncate_text(str(row[i]), col_widths[i])
-            else:
-                cell_text = ""
-            row_parts.append(pad_text(cell_text, col_widths[i]))
-        lines.append("│" + "│".join(row_parts) + "│")
+    header_row = "│%s│" % "│".join(
+        pad_text(truncate_text(str(header), w), w, align="center")
+        for header, w in zip(headers, widths)
+    )
     
-    # Bottom border
-    border_bottom = "└" + "┴".join("─" * w for w in col_widths) + "┘"
+    lines = [border_top, header_row, separator]
+    # Rows (short rows are padded with empty cells)
+    lines.extend(
+        "│%s│" % "│".join(
+            pad_text(truncate_text(str(row[i]), w) if i < len(row) else "", w)
+            for i, w in enumerate(widths)
+        )
+        for row in rows
+    )
     lines.append(border_bottom)
     
     return lines
@@ -257,6 +343,96 @@ def format_metric(label: str, value: str, width: int = 80) -> str:
     return f"  {label_padded}  {value_padded}"
 
 
+# Column widths used by format_metric at the default 80-column width
+_METRIC_LABEL_WIDTH = 30
+_METRIC_VALUE_WIDTH = 80 - _METRIC_LABEL_WIDTH - 4
+
+
+def _metric_pad(text: str, width: int = _METRIC_VALUE_WIDTH) -> str:
+    """Spaces that pad text out to a metric column"""
+    return " " * max(0, width - visible_width(text))
+
+
+def _metric_label(text: str) -> Tuple[str, str]:
+    """Static metric label paired with its precomputed column padding"""
+    return text, _metric_pad(text, _METRIC_LABEL_WIDTH)
+
+
+_GOLDEN_LABEL, _GOLDEN_PAD = _metric_label(f"{Icons.FILE} Golden Baseline")
+_SUSPECT_LABEL, _SUSPECT_PAD = _metric_label(f"{Icons.FILE} Suspect Bitstream")
+_TIME_LABEL, _TIME_PAD = _metric_label(f"{Icons.CLOCK} Detection Time")
+_CONFIDENCE_LABEL, _CONFIDENCE_PAD = _metric_label(f"{Icons.TARGET} Confidence")
+_COMPARED_LABEL, _COMPARED_PAD = _metric_label("Frames Compared")
+_MODIFIED_LABEL, _MODIFIED_PAD = _metric_label("Frames Modified")
+_BITS_LABEL, _BITS_PAD = _metric_label("Total Bits Changed")
+_ANOMALIES_LABEL, _ANOMALIES_PAD = _metric_label("Total Anomalies")
+
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Fixed Markdown tables, filled in with one str.format call per report
+_MD_STATS_TMPL = (
+    "| Metric | Value |\n"
+    "|--------|-------|\n"
+    "| Frames Compared | {fc:,} |\n"
+    "| Frames Modified | {fm:,} |\n"
+    "| Total Bits Changed | {tb:,} |\n"
+    "| Total Anomalies | {ta:,} |\n"
+)
+_MD_SEVERITY_TMPL = (
+    "| Severity | Count |\n"
+    "|----------|-------|\n"
+    "| 🔴 CRITICAL | {critical} |\n"
+    "| 🟡 HIGH | {high} |\n"
+    "| 🔵 MEDIUM | {medium} |\n"
+    "| ⚪ LOW | {low} |\n"
+)
+_MD_TYPE_ROW_TMPL = "| {} | {} |\n"
+
+# How many anomalies each text section lists before summarizing the rest
+_HIGH_FINDINGS_LIMIT = 10
+_TOP_TYPES_LIMIT = 10
+_UNUSED_REGIONS_LIMIT = 5
+_ROUTING_ANALYSIS_LIMIT = 3
+
+
+@dataclass
+class _ReportCache:
+    """Anomaly subsets derived from one report, shared across output formats"""
+    critical_anomalies: List[FrameAnomaly]
+    high_anomalies: List[FrameAnomaly]      # first _HIGH_FINDINGS_LIMIT only
+    unused_anomalies: List[FrameAnomaly]
+    routing_anomalies: List[FrameAnomaly]
+    top_types: List[Tuple[str, int]]
+    detection_time: str
+    generated_at: str
+    
+    @classmethod
+    def from_report(cls, report: AnomalyReport) -> "_ReportCache":
+        """Collect every subset in a single pass over the anomalies"""
+        critical, high, unused, routing = [], [], [], []
+        for anomaly in report.anomalies:
+            if anomaly.severity == SeverityLevel.CRITICAL:
+                critical.append(anomaly)
+            elif anomaly.severity == SeverityLevel.HIGH:
+                # Only the first few HIGH findings are ever listed
+                if len(high) < _HIGH_FINDINGS_LIMIT:
+                    high.append(anomaly)
+            if anomaly.is_in_unused_region():
+                unused.append(anomaly)
+            if anomaly.is_routing_frame:
+                routing.append(anomaly)
+        # Top types by count descending (same order as a stable descending
+        # sort), shared by the text and Markdown type tables
+        top_types = heapq.nlargest(_TOP_TYPES_LIMIT, report.type_counts.items(),
+                                   key=itemgetter(1))
+        # Timestamps are formatted once, so every format built from this
+        # cache shows the same "generated" time
+        detection_time = report.detection_timestamp.strftime(_TIMESTAMP_FORMAT)
+        generated_at = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        return cls(critical, high, unused, routing, top_types, detection_time, generated_at)
+
+
 # ============================================================================
 # Simple Report Generator
 # ============================================================================
@@ -285,10 +461,15 @@ class SimpleReportGenerator:
         text = generator.generate_text_report(report)
         print(text)
         
+        # Or print it to the terminal in a single write
+        generator.print_text_report(report)
+        
         # Save in all formats
         files = generator.generate_all_formats(report, "output_dir")
     """
     
+    __slots__ = ('use_colors', 'reports_generated', '_colorize')
+    
     def __init__(self, use_colors: bool = True):
         """
         Initialize the report generator
@@ -298,6 +479,14 @@ class SimpleReportGenerator:
         """
         self.use_colors = use_colors and HAS_COLOR
         self.reports_generated = 0
+        # Status messages skip the TTY check entirely when colors are off
+        self._colorize = colorize if self.use_colors else _no_color
+    
+    def _resolve_styles(self) -> SimpleNamespace:
+        """Pick colored or plain styles (colors need use_colors and a TTY)"""
+        if self.use_colors and sys.stdout.isatty():
+            return _COLOR_STYLES
+        return _PLAIN_STYLES
     
     # ========================================================================
     # Text Report Generation
@@ -306,7 +495,8 @@ class SimpleReportGenerator:
     def generate_text_report(self, 
                             report: AnomalyReport,
                             detail_level: str = "summary",
-                            width: int = 80) -> str:
+                            width: int = 80,
+                            cache: Optional[_ReportCache] = None) -> str:
         """
         Generate professional text report with colors and formatting
         
@@ -314,431 +504,445 @@ class SimpleReportGenerator:
             report: AnomalyReport to format
             detail_level: "summary", "detailed", or "full"
             width: Report width in characters
+            cache: Precomputed anomaly subsets (built from report if None)
             
         Returns:
             Formatted text report with ANSI colors
         """
-        lines = []
+        return self._render_text_report(report, detail_level, width,
+                                        self._resolve_styles(), cache)
+    
+    def _render_text_report(self, report: AnomalyReport, detail_level: str,
+                            width: int, styles: SimpleNamespace,
+                            cache: Optional[_ReportCache] = None) -> str:
+        """Render the text report with the given style set"""
+        # The style set is passed down to every section helper, so one
+        # generator (such as the shared quick_report instance) can render
+        # from several threads
+        st = styles
+        buf = io.StringIO()
+        write = buf.write
+        
+        # Anomaly subsets shared by the verdict, sections and recommendations
+        if cache is None:
+            cache = _ReportCache.from_report(report)
+        unused_anomalies = cache.unused_anomalies
+        routing_anomalies = cache.routing_anomalies
         
         # Header
-        lines.append(colorize(draw_header("FPGA TROJAN DETECTION REPORT", width), 
-                             Colors.PRIMARY + Colors.BRIGHT))
-        lines.append("")
+        write(f'{st.primary_bright}{draw_header("FPGA TROJAN DETECTION REPORT", width, use_colors=st is _COLOR_STYLES)}{st.reset}\n')
+        write("\n")
         
         # Verdict Banner
-        lines.append(self._format_verdict(report))
-        lines.append("")
+        write(self._format_verdict(report, len(routing_anomalies), st))
+        write("\n")
+        write("\n")
         
         # Detection Metadata
-        lines.append(colorize(draw_section("Detection Metadata", Icons.CLOCK), 
-                             Colors.SECONDARY + Colors.BRIGHT))
-        lines.extend(self._format_metadata(report, width))
-        lines.append("")
+        write(f'{st.secondary_bright}{draw_section("Detection Metadata", Icons.CLOCK)}{st.reset}\n')
+        self._format_metadata(report, cache.detection_time, width, write, st)
+        write("\n")
         
         # Statistics Overview
-        lines.append(colorize(draw_section("Statistics Overview", Icons.CHART), 
-                             Colors.SECONDARY + Colors.BRIGHT))
-        lines.extend(self._format_statistics(report, width))
-        lines.append("")
+        write(f'{st.secondary_bright}{draw_section("Statistics Overview", Icons.CHART)}{st.reset}\n')
+        self._format_statistics(report, width, write, st)
+        write("\n")
         
         # Severity Breakdown
-        lines.append(colorize(draw_section("Anomaly Severity Distribution", Icons.TARGET), 
-                             Colors.SECONDARY + Colors.BRIGHT))
-        lines.extend(self._format_severity_breakdown(report))
-        lines.append("")
+        write(f'{st.secondary_bright}{draw_section("Anomaly Severity Distribution", Icons.TARGET)}{st.reset}\n')
+        self._format_severity_breakdown(report, write, st)
+        write("\n")
         
         # Type Breakdown
         if report.type_counts:
-            lines.append(colorize(draw_section("Anomaly Types", Icons.GEAR), 
-                                 Colors.SECONDARY + Colors.BRIGHT))
-            lines.extend(self._format_type_breakdown(report))
-            lines.append("")
+            write(f'{st.secondary_bright}{draw_section("Anomaly Types", Icons.GEAR)}{st.reset}\n')
+            self._format_type_breakdown(report, cache.top_types, write, st)
+            write("\n")
         
         # Critical Findings
         if report.critical_count > 0:
-            lines.append(colorize(draw_section("Critical Findings", Icons.ALERT), 
-                                 Colors.ERROR + Colors.BRIGHT))
-            lines.extend(self._format_critical_findings(report, detail_level))
-            lines.append("")
+            write(f'{st.error_bright}{draw_section("Critical Findings", Icons.ALERT)}{st.reset}\n')
+            self._format_critical_findings(report, cache.critical_anomalies, detail_level, write, st)
+            write("\n")
         
         # High Severity Findings
         if report.high_count > 0 and detail_level in ["detailed", "full"]:
-            lines.append(colorize(draw_section("High Severity Findings", Icons.WARNING), 
-                                 Colors.WARNING + Colors.BRIGHT))
-            lines.extend(self._format_high_findings(report, detail_level))
-            lines.append("")
+            write(f'{st.warning_bright}{draw_section("High Severity Findings", Icons.WARNING)}{st.reset}\n')
+            self._format_high_findings(report, cache.high_anomalies, detail_level, write, st)
+            write("\n")
         
         # Unused Region Analysis
-        unused_anomalies = report.get_unused_region_anomalies()
         if unused_anomalies:
-            lines.append(colorize(draw_section("Unused Region Modifications", Icons.SHIELD), 
-                                 Colors.CRITICAL + Colors.BRIGHT))
-            lines.append(colorize("  ⚠ Prime locations for hardware Trojan insertion", 
-                                 Colors.WARNING))
-            lines.append("")
-            lines.extend(self._format_unused_regions(report, unused_anomalies, detail_level))
-            lines.append("")
+            write(f'{st.critical_bright}{draw_section("Unused Region Modifications", Icons.SHIELD)}{st.reset}\n')
+            write(f"{st.warning}  ⚠ Prime locations for hardware Trojan insertion{st.reset}\n")
+            write("\n")
+            self._format_unused_regions(report, unused_anomalies, detail_level, write, st)
+            write("\n")
         
         # Routing Analysis
-        routing_anomalies = report.get_routing_anomalies()
         if routing_anomalies and detail_level in ["detailed", "full"]:
-            lines.append(colorize(draw_section("Routing Modifications", Icons.TARGET), 
-                                 Colors.WARNING + Colors.BRIGHT))
-            lines.extend(self._format_routing_analysis(routing_anomalies))
-            lines.append("")
+            write(f'{st.warning_bright}{draw_section("Routing Modifications", Icons.TARGET)}{st.reset}\n')
+            self._format_routing_analysis(routing_anomalies, write, st)
+            write("\n")
         
         # Recommendations
-        lines.append(colorize(draw_section("Security Recommendations", Icons.SHIELD), 
-                             Colors.PRIMARY + Colors.BRIGHT))
-        lines.extend(self._format_recommendations(report))
-        lines.append("")
+        write(f'{st.primary_bright}{draw_section("Security Recommendations", Icons.SHIELD)}{st.reset}\n')
+        self._format_recommendations(report, unused_anomalies, routing_anomalies, write, st)
+        write("\n")
         
         # Summary Narrative
         if report.summary:
-            lines.append(colorize(draw_section("Analysis Summary", Icons.FILE), 
-                                 Colors.SECONDARY + Colors.BRIGHT))
-            lines.extend(self._format_summary_narrative(report.summary))
-            lines.append("")
+            write(f'{st.secondary_bright}{draw_section("Analysis Summary", Icons.FILE)}{st.reset}\n')
+            self._format_summary_narrative(report.summary, write, st)
+            write("\n")
         
         # Footer
-        lines.append(colorize(draw_separator(width, "═"), Colors.DIM))
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        footer = pad_text(f"Report generated: {timestamp}", width, align="center")
-        lines.append(colorize(footer, Colors.DIM))
-        lines.append(colorize(draw_separator(width, "═"), Colors.DIM))
+        write(f'{st.dim}{draw_separator(width, "═")}{st.reset}\n')
+        footer = pad_text(f"Report generated: {cache.generated_at}", width, align="center")
+        write(f"{st.dim}{footer}{st.reset}\n")
+        write(f'{st.dim}{draw_separator(width, "═")}{st.reset}')  # last line: no newline
         
         self.reports_generated += 1
         
-        return "\n".join(lines)
+        return buf.getvalue()
     
-    def _format_verdict(self, report: AnomalyReport) -> str:
+    def print_text_report(self,
+                          report: AnomalyReport,
+                          detail_level: str = "summary",
+                          width: int = 80) -> None:
+        """
+        Print the text report to stdout with one write
+        
+        Same output as print(generate_text_report(...)), but the whole
+        report goes to the underlying binary buffer at once instead of
+        one write per line on a line-buffered TTY.
+        
+        Args:
+            report: AnomalyReport to format
+            detail_level: "summary", "detailed", or "full"
+            width: Report width in characters
+        """
+        text = self.generate_text_report(report, detail_level, width) + "\n"
+        stream = sys.stdout
+        raw = getattr(stream, "buffer", None)
+        if raw is None or sys.platform == "win32":
+            # No binary buffer (e.g. redirected to StringIO), or colorama
+            # may need to translate ANSI codes on the text stream
+            stream.write(text)
+            stream.flush()
+            return
+        stream.flush()  # keep ordering with earlier print() output
+        raw.write(text.encode(stream.encoding or "utf-8", stream.errors or "strict"))
+        raw.flush()
+    
+    def _format_verdict(self, report: AnomalyReport, routing_mods: int,
+                        st: SimpleNamespace) -> str:
         """Format verdict banner with appropriate styling"""
-        routing_mods = len(report.get_routing_anomalies())
         
         if report.trojan_detected:
             verdict = f"{Icons.ALERT}  VERDICT: TROJAN DETECTED  {Icons.ALERT}"
-            return colorize(pad_text(verdict, 80, align="center"), 
-                          Colors.ERROR + Colors.BRIGHT + Back.BLACK)
+            return f'{st.error_bright_on_black}{pad_text(verdict, 80, align="center")}{st.reset}'
         elif report.critical_count > 0 or report.high_count > 0:
             verdict = f"{Icons.WARNING} VERDICT: SUSPICIOUS MODIFICATIONS FOUND"
-            return colorize(pad_text(verdict, 80, align="center"), 
-                          Colors.WARNING + Colors.BRIGHT)
+            return f'{st.warning_bright}{pad_text(verdict, 80, align="center")}{st.reset}'
         elif len(report) > 0 or routing_mods > 0 or report.total_bits_changed > 0:
             verdict = f"{Icons.WARNING} VERDICT: MODIFICATIONS DETECTED"
-            return colorize(pad_text(verdict, 80, align="center"), 
-                          Colors.WARNING)
+            return f'{st.warning}{pad_text(verdict, 80, align="center")}{st.reset}'
         else:
             verdict = f"{Icons.CHECK_CIRCLE} VERDICT: NO SIGNIFICANT ANOMALIES"
-            return colorize(pad_text(verdict, 80, align="center"), 
-                          Colors.SUCCESS + Colors.BRIGHT)
+            return f'{st.success_bright}{pad_text(verdict, 80, align="center")}{st.reset}'
     
-    def _format_metadata(self, report: AnomalyReport, width: int) -> List[str]:
+    def _format_metadata(self, report: AnomalyReport, detection_time: str, width: int,
+                         write: Callable[[str], None],
+                         st: SimpleNamespace) -> None:
         """Format detection metadata"""
-        lines = []
-        
-        metrics = [
-            (f"{Icons.FILE} Golden Baseline", report.golden_id),
-            (f"{Icons.FILE} Suspect Bitstream", report.suspect_id),
-            (f"{Icons.CLOCK} Detection Time", 
-             report.detection_timestamp.strftime("%Y-%m-%d %H:%M:%S")),
-            (f"{Icons.TARGET} Confidence", f"{report.confidence:.1%}"),
-        ]
-        
-        for label, value in metrics:
-            lines.append(format_metric(
-                colorize(label, Colors.PRIMARY),
-                colorize(str(value), Colors.BRIGHT)
-            ))
-        
-        return lines
+        label, value, reset = st.primary, st.bright, st.reset
+        
+        golden = str(report.golden_id)
+        suspect = str(report.suspect_id)
+        confidence = f"{report.confidence:.1%}"
+        
+        # Same layout as format_metric, unrolled (label padding is static)
+        write(
+            f"  {label}{_GOLDEN_LABEL}{reset}{_GOLDEN_PAD}  "
+            f"{value}{golden}{reset}{_metric_pad(golden)}\n"
+            f"  {label}{_SUSPECT_LABEL}{reset}{_SUSPECT_PAD}  "
+            f"{value}{suspect}{reset}{_metric_pad(suspect)}\n"
+            f"  {label}{_TIME_LABEL}{reset}{_TIME_PAD}  "
+            f"{value}{detection_time}{reset}{_metric_pad(detection_time)}\n"
+            f"  {label}{_CONFIDENCE_LABEL}{reset}{_CONFIDENCE_PAD}  "
+            f"{value}{confidence}{reset}{_metric_pad(confidence)}\n"
+        )
     
-    def _format_statistics(self, report: AnomalyReport, width: int) -> List[str]:
+    def _format_statistics(self, report: AnomalyReport, width: int,
+                           write: Callable[[str], None],
+                           st: SimpleNamespace) -> None:
         """Format statistics overview"""
-        lines = []
+        label, info, bright, reset = st.dim, st.info, st.bright, st.reset
         
         # Frame statistics
         frame_pct = (report.frames_with_differences / max(1, report.total_frames_compared)) * 100
         
-        stats = [
-            ("Frames Compared", f"{report.total_frames_compared:,}"),
-            ("Frames Modified", 
-             f"{report.frames_with_differences:,} ({frame_pct:.2f}%)"),
-            ("Total Bits Changed", f"{report.total_bits_changed:,}"),
-            ("Total Anomalies", f"{len(report):,}"),
-        ]
-        
-        for label, value in stats:
-            color = Colors.BRIGHT if "Modified" in label or "Changed" in label else Colors.INFO
-            lines.append(format_metric(
-                colorize(label, Colors.DIM),
-                colorize(value, color)
-            ))
-        
-        return lines
+        compared = f"{report.total_frames_compared:,}"
+        modified = f"{report.frames_with_differences:,} ({frame_pct:.2f}%)"
+        bits = f"{report.total_bits_changed:,}"
+        anomalies = f"{len(report):,}"
+        
+        # Changes are highlighted, totals use the info color
+        write(
+            f"  {label}{_COMPARED_LABEL}{reset}{_COMPARED_PAD}  "
+            f"{info}{compared}{reset}{_metric_pad(compared)}\n"
+            f"  {label}{_MODIFIED_LABEL}{reset}{_MODIFIED_PAD}  "
+            f"{bright}{modified}{reset}{_metric_pad(modified)}\n"
+            f"  {label}{_BITS_LABEL}{reset}{_BITS_PAD}  "
+            f"{bright}{bits}{reset}{_metric_pad(bits)}\n"
+            f"  {label}{_ANOMALIES_LABEL}{reset}{_ANOMALIES_PAD}  "
+            f"{info}{anomalies}{reset}{_metric_pad(anomalies)}\n"
+        )
     
-    def _format_severity_breakdown(self, report: AnomalyReport) -> List[str]:
+    def _format_severity_breakdown(self, report: AnomalyReport,
+                                   write: Callable[[str], None],
+                                   st: SimpleNamespace) -> None:
         """Format severity distribution with visual bars"""
-        lines = []
         
         total = len(report)
-        severities = [
-            ("CRITICAL", report.critical_count, Colors.ERROR),
-            ("HIGH", report.high_count, Colors.WARNING),
-            ("MEDIUM", report.medium_count, Colors.PRIMARY),
-            ("LOW", report.low_count, Colors.DIM),
-        ]
+        counts = (report.critical_count, report.high_count,
+                  report.medium_count, report.low_count)
+        colors = (st.error, st.warning, st.primary, st.dim)
         
-        max_count = max((count for _, count, _ in severities), default=1)
+        max_count = max(counts)
         
-        for severity, count, color in severities:
-            icon = SEVERITY_ICONS.get(severity, severity)
+        for icon, count, color in zip(_SEVERITY_ROW_ICONS, counts, colors):
             pct = (count / max(1, total)) * 100
             
             # Visual bar
-            bar_width = 40
-            filled = int((count / max(1, max_count)) * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
+            filled = int((count / max(1, max_count)) * _BAR_WIDTH)
+            bar = _SEVERITY_BARS[filled]
             
-            label = colorize(icon, color)
-            count_str = colorize(str(count).rjust(5), color)
-            pct_str = colorize(f"({pct:5.1f}%)", Colors.DIM)
-            line = f"  {pad_text(label, 30)} {count_str} {pad_text(pct_str, 10)} {colorize(bar, color)}"
+            label = f"{color}{icon}{st.reset}"
+            count_str = f"{color}{str(count).rjust(5)}{st.reset}"
+            pct_str = f"{st.dim}({pct:5.1f}%){st.reset}"
+            line = f"  {pad_text(label, 30)} {count_str} {pad_text(pct_str, 10)} {color}{bar}{st.reset}"
             
-            lines.append(line)
-        
-        return lines
+            write(line)
+            write("\n")
     
-    def _format_type_breakdown(self, report: AnomalyReport) -> List[str]:
+    def _format_type_breakdown(self, report: AnomalyReport,
+                               top_types: List[Tuple[str, int]],
+                               write: Callable[[str], None],
+                               st: SimpleNamespace) -> None:
         """Format anomaly type distribution"""
-        lines = []
-        
-        # Sort by count descending
-        sorted_types = sorted(report.type_counts.items(), 
-                            key=lambda x: x[1], reverse=True)
         
         headers = ["Type", "Count"]
         rows = []
         
-        for atype, count in sorted_types[:10]:  # Top 10
+        for atype, count in top_types:
             rows.append([
                 truncate_text(atype, 40),
-                colorize(str(count), Colors.BRIGHT)
+                f"{st.bright}{str(count)}{st.reset}"
             ])
         
-        if len(sorted_types) > 10:
-            remaining = sum(count for _, count in sorted_types[10:])
+        if len(report.type_counts) > _TOP_TYPES_LIMIT:
+            remaining = sum(report.type_counts.values()) - sum(count for _, count in top_types)
             rows.append([
-                colorize("... others", Colors.DIM),
-                colorize(str(remaining), Colors.DIM)
+                f"{st.dim}... others{st.reset}",
+                f"{st.dim}{str(remaining)}{st.reset}"
             ])
         
         table_lines = format_table(headers, rows, col_widths=[42, 10])
-        lines.extend([f"  {line}" for line in table_lines])
-        
-        return lines
+        for line in table_lines:
+            write(f"  {line}\n")
     
     def _format_critical_findings(self, report: AnomalyReport, 
-                                  detail_level: str) -> List[str]:
+                                  critical_anomalies: List[FrameAnomaly],
+                                  detail_level: str,
+                                  write: Callable[[str], None],
+                                  st: SimpleNamespace) -> None:
         """Format critical anomalies"""
-        lines = []
-        
-        for i, anomaly in enumerate(report.get_critical_anomalies(), 1):
-            lines.append(colorize(f"  {i}. {anomaly.far_hex} - {anomaly.block_type_name}", 
-                                 Colors.ERROR + Colors.BRIGHT))
-            lines.extend(self._format_anomaly_details(anomaly, detail_level, indent=5))
-            lines.append("")
-        
-        return lines
+        # Loop-invariant lookups bound once
+        title, reset = st.error_bright, st.reset
+        format_details = self._format_anomaly_details
+        
+        for i, anomaly in enumerate(critical_anomalies, 1):
+            write(f"{title}  {i}. {anomaly.far_hex} - {anomaly.block_type_name}{reset}\n")
+            format_details(anomaly, detail_level, write, st, indent=5)
+            write("\n")
     
     def _format_high_findings(self, report: AnomalyReport, 
-                             detail_level: str) -> List[str]:
+                             high_anomalies: List[FrameAnomaly],
+                             detail_level: str,
+                             write: Callable[[str], None],
+                             st: SimpleNamespace) -> None:
         """Format high severity anomalies"""
-        lines = []
-        
-        high_anomalies = report.get_high_severity_anomalies()[:10]  # Top 10
-        
-        for i, anomaly in enumerate(high_anomalies, 1):
-            lines.append(colorize(f"  {i}. {anomaly.far_hex} - {anomaly.block_type_name}", 
-                                 Colors.WARNING + Colors.BRIGHT))
-            lines.extend(self._format_anomaly_details(anomaly, "summary", indent=5))
-            lines.append("")
-        
-        if report.high_count > 10:
-            remaining = report.high_count - 10
-            lines.append(colorize(f"  ... and {remaining} more HIGH severity anomalies", 
-                                 Colors.DIM))
-            lines.append("")
-        
-        return lines
+        title, reset = st.warning_bright, st.reset
+        format_details = self._format_anomaly_details
+        
+        for i, anomaly in enumerate(islice(high_anomalies, _HIGH_FINDINGS_LIMIT), 1):
+            write(f"{title}  {i}. {anomaly.far_hex} - {anomaly.block_type_name}{reset}\n")
+            format_details(anomaly, "summary", write, st, indent=5)
+            write("\n")
+        
+        if report.high_count > _HIGH_FINDINGS_LIMIT:
+            remaining = report.high_count - _HIGH_FINDINGS_LIMIT
+            write(f"{st.dim}  ... and {remaining} more HIGH severity anomalies{st.reset}\n")
+            write("\n")
     
     def _format_unused_regions(self, report: AnomalyReport, 
                               unused_anomalies: List[FrameAnomaly],
-                              detail_level: str) -> List[str]:
+                              detail_level: str,
+                              write: Callable[[str], None],
+                              st: SimpleNamespace) -> None:
         """Format unused region anomalies"""
-        lines = []
-        
-        lines.append(colorize(f"  Total: {len(unused_anomalies)} anomalies in unused regions", 
-                             Colors.WARNING))
-        lines.append("")
         
-        for i, anomaly in enumerate(unused_anomalies[:5], 1):  # Top 5
-            lines.append(colorize(f"  {i}. {anomaly.far_hex} - {anomaly.block_type_name}", 
-                                 Colors.WARNING + Colors.BRIGHT))
-            lines.extend(self._format_anomaly_details(anomaly, detail_level, indent=5))
-            lines.append("")
+        write(f"{st.warning}  Total: {len(unused_anomalies)} anomalies in unused regions{st.reset}\n")
+        write("\n")
         
-        if len(unused_anomalies) > 5:
-            lines.append(colorize(f"  ... and {len(unused_anomalies) - 5} more", 
-                                 Colors.DIM))
-            lines.append("")
+        title, reset = st.warning_bright, st.reset
+        format_details = self._format_anomaly_details
+        for i, anomaly in enumerate(islice(unused_anomalies, _UNUSED_REGIONS_LIMIT), 1):
+            write(f"{title}  {i}. {anomaly.far_hex} - {anomaly.block_type_name}{reset}\n")
+            format_details(anomaly, detail_level, write, st, indent=5)
+            write("\n")
         
-        return lines
+        if len(unused_anomalies) > _UNUSED_REGIONS_LIMIT:
+            write(f"{st.dim}  ... and {len(unused_anomalies) - _UNUSED_REGIONS_LIMIT} more{st.reset}\n")
+            write("\n")
     
-    def _format_routing_analysis(self, routing_anomalies: List[FrameAnomaly]) -> List[str]:
+    def _format_routing_analysis(self, routing_anomalies: List[FrameAnomaly],
+                                 write: Callable[[str], None],
+                                 st: SimpleNamespace) -> None:
         """Format routing modification analysis"""
-        lines = []
-        
-        lines.append(colorize(f"  Total: {len(routing_anomalies)} routing modifications", 
-                             Colors.WARNING))
-        lines.append(colorize("  ⚠ May indicate routing detours or covert channels", 
-                             Colors.DIM))
-        lines.append("")
-        
-        for i, anomaly in enumerate(routing_anomalies[:3], 1):  # Top 3
-            lines.append(colorize(f"  {i}. {anomaly.far_hex}", 
-                                 Colors.WARNING))
-            lines.append(colorize(f"     {Icons.BULLET} {anomaly.suspicion_reason}", 
-                                 Colors.DIM))
-            lines.append("")
-        
-        return lines
+        
+        write(f"{st.warning}  Total: {len(routing_anomalies)} routing modifications{st.reset}\n")
+        write(f"{st.dim}  ⚠ May indicate routing detours or covert channels{st.reset}\n")
+        write("\n")
+        
+        warning, dim, reset = st.warning, st.dim, st.reset
+        bullet = Icons.BULLET
+        for i, anomaly in enumerate(islice(routing_anomalies, _ROUTING_ANALYSIS_LIMIT), 1):
+            write(f"{warning}  {i}. {anomaly.far_hex}{reset}\n"
+                  f"{dim}     {bullet} {anomaly.suspicion_reason}{reset}\n"
+                  "\n")
     
     def _format_anomaly_details(self, anomaly: FrameAnomaly, 
-                               detail_level: str, indent: int = 3) -> List[str]:
+                               detail_level: str, write: Callable[[str], None],
+                               st: SimpleNamespace, indent: int = 3) -> None:
         """Format details for a single anomaly"""
-        lines = []
+        # Style codes used below, bound once as locals
+        info, dim, warning, bright, reset = st.info, st.dim, st.warning, st.bright, st.reset
         prefix = " " * indent
+        # Lead-in shared by every bullet line of this anomaly
+        bullet = f"{prefix}{Icons.BULLET}"
         
-        # Basic details
-        severity_color = SEVERITY_COLORS.get(anomaly.severity.value, Colors.INFO)
-        lines.append(colorize(f"{prefix}{Icons.BULLET} Severity: {anomaly.severity.value}", 
-                             severity_color))
-        lines.append(colorize(f"{prefix}{Icons.BULLET} Type: {anomaly.anomaly_type.value}", 
-                             Colors.INFO))
-        lines.append(colorize(f"{prefix}{Icons.BULLET} Location: Column {anomaly.column}, Minor {anomaly.minor}", 
-                             Colors.DIM))
-        lines.append(colorize(f"{prefix}{Icons.BULLET} Bits Changed: {anomaly.bits_changed}", 
-                             Colors.BRIGHT))
+        # Basic details (the four fixed lines go out in one write)
+        severity = anomaly.severity.value
+        write(f"{st.severity[severity]}{bullet} Severity: {severity}{reset}\n"
+              f"{info}{bullet} Type: {anomaly.anomaly_type.value}{reset}\n"
+              f"{dim}{bullet} Location: Column {anomaly.column}, Minor {anomaly.minor}{reset}\n"
+              f"{bright}{bullet} Bits Changed: {anomaly.bits_changed}{reset}\n")
         
         if detail_level in ["detailed", "full"]:
-            lines.append(colorize(f"{prefix}{Icons.BULLET} Tiles Affected: {len(anomaly.tiles_affected)}", 
-                                 Colors.DIM))
+            tiles_affected = anomaly.tiles_affected
+            write(f"{dim}{bullet} Tiles Affected: {len(tiles_affected)}{reset}\n")
             if anomaly.tiles_unused:
-                lines.append(colorize(f"{prefix}  {Icons.ARROW_RIGHT} {len(anomaly.tiles_unused)} in unused region", 
-                                     Colors.WARNING))
+                write(f"{warning}{prefix}  {Icons.ARROW_RIGHT} {len(anomaly.tiles_unused)} in unused region{reset}\n")
             
             if anomaly.suspicion_reason:
-                lines.append(colorize(f"{prefix}{Icons.BULLET} Reason: {anomaly.suspicion_reason}", 
-                                     Colors.DIM))
+                write(f"{dim}{bullet} Reason: {anomaly.suspicion_reason}{reset}\n")
             
             if anomaly.attack_vectors:
                 vectors = ", ".join(anomaly.attack_vectors)
-                lines.append(colorize(f"{prefix}{Icons.BULLET} Attack Vectors: {vectors}", 
-                                     Colors.WARNING))
+                write(f"{warning}{bullet} Attack Vectors: {vectors}{reset}\n")
         
         if detail_level == "full":
-            if anomaly.tiles_affected:
-                tiles_display = ", ".join(anomaly.tiles_affected[:5])
-                if len(anomaly.tiles_affected) > 5:
-                    tiles_display += f", ... (+{len(anomaly.tiles_affected)-5} more)"
-                lines.append(colorize(f"{prefix}{Icons.BULLET} Affected Tiles: {tiles_display}", 
-                                     Colors.DIM))
-        
-        return lines
+            tiles_affected = anomaly.tiles_affected
+            if tiles_affected:
+                tiles_display = ", ".join(tiles_affected[:5])
+                if len(tiles_affected) > 5:
+                    tiles_display += f", ... (+{len(tiles_affected)-5} more)"
+                write(f"{dim}{bullet} Affected Tiles: {tiles_display}{reset}\n")
     
-    def _format_recommendations(self, report: AnomalyReport) -> List[str]:
+    def _format_recommendations(self, report: AnomalyReport,
+                                unused_anomalies: List[FrameAnomaly],
+                                routing_anomalies: List[FrameAnomaly],
+                                write: Callable[[str], None],
+                                st: SimpleNamespace) -> None:
         """Generate security recommendations"""
-        lines = []
         
         if report.trojan_detected:
-            lines.append(colorize(f"  {Icons.ALERT} IMMEDIATE ACTION REQUIRED:", 
-                                 Colors.ERROR + Colors.BRIGHT))
-            lines.append(colorize(f"  {Icons.CROSS} DO NOT deploy this bitstream to production", 
-                                 Colors.ERROR))
-            lines.append(colorize(f"  {Icons.BULLET} Investigate bitstream source and provenance", 
-                                 Colors.WARNING))
-            lines.append(colorize(f"  {Icons.BULLET} Review synthesis/build toolchain for compromise", 
-                                 Colors.WARNING))
-            lines.append(colorize(f"  {Icons.BULLET} Conduct detailed manual inspection of critical findings", 
-                                 Colors.WARNING))
-            lines.append("")
+            write(f"{st.error_bright}  {Icons.ALERT} IMMEDIATE ACTION REQUIRED:{st.reset}\n")
+            write(f"{st.error}  {Icons.CROSS} DO NOT deploy this bitstream to production{st.reset}\n")
+            write(f"{st.warning}  {Icons.BULLET} Investigate bitstream source and provenance{st.reset}\n")
+            write(f"{st.warning}  {Icons.BULLET} Review synthesis/build toolchain for compromise{st.reset}\n")
+            write(f"{st.warning}  {Icons.BULLET} Conduct detailed manual inspection of critical findings{st.reset}\n")
+            write("\n")
         
         recs = []
         
         if report.critical_count > 0:
             recs.append((Icons.WARNING, 
                         "Critical anomalies detected - manual inspection required",
-                        Colors.ERROR))
+                        st.error))
         
-        unused_anomalies = report.get_unused_region_anomalies()
         if unused_anomalies:
             recs.append((Icons.SHIELD, 
                         f"{len(unused_anomalies)} modifications in unused regions (high Trojan risk)",
-                        Colors.WARNING))
+                        st.warning))
         
-        routing_anomalies = report.get_routing_anomalies()
         if routing_anomalies:
             recs.append((Icons.TARGET, 
                         f"{len(routing_anomalies)} routing modifications (check for detours/covert channels)",
-                        Colors.WARNING))
+                        st.warning))
         
         if report.high_count > 10:
             recs.append((Icons.CHART, 
                         f"{report.high_count} high-severity anomalies require comprehensive analysis",
-                        Colors.WARNING))
+                        st.warning))
         
         if not report.trojan_detected and not recs:
             recs.append((Icons.CHECK_CIRCLE, 
                         "No significant anomalies detected",
-                        Colors.SUCCESS))
+                        st.success))
             recs.append((Icons.CHECKMARK, 
                         "Bitstream appears to match golden baseline",
-                        Colors.SUCCESS))
+                        st.success))
             recs.append((Icons.CLOCK, 
                         "Consider periodic re-verification",
-                        Colors.INFO))
+                        st.info))
         
         for icon, text, color in recs:
-            lines.append(colorize(f"  {icon} {text}", color))
-        
-        return lines
+            write(f"{color}  {icon} {text}{st.reset}\n")
     
-    def _format_summary_narrative(self, summary: str) -> List[str]:
+    def _format_summary_narrative(self, summary: str,
+                                  write: Callable[[str], None],
+                                  st: SimpleNamespace) -> None:
         """Format summary narrative"""
-        lines = []
         
         for line in summary.splitlines():
             if line.strip():
-                lines.append(colorize(f"  {line}", Colors.INFO))
-        
-        return lines
+                write(f"{st.info}  {line}{st.reset}\n")
     
     # ========================================================================
     # JSON Report Generation
     # ========================================================================
     
-    def generate_json_report(self, report: AnomalyReport) -> str:
+    @staticmethod
+    def generate_json_report(report: AnomalyReport) -> str:
         """
         Generate JSON report for machine processing
         
+        Serialized by orjson when it is installed, otherwise by the stdlib
+        json module; see dumps_json_bytes() for where the two differ.
+        to_json() already converts timestamps and enums to strings, so no
+        orjson type options are needed.
+        
         Args:
             report: AnomalyReport to serialize
             
         Returns:
             Pretty-printed JSON string
         """
-        report_dict = report.to_json()
-        return json.dumps(report_dict, indent=2, sort_keys=True)
+        return dumps_json(report.to_json())
     
     def save_json_report(self, report: AnomalyReport, filepath: str) -> bool:
         """
@@ -755,20 +959,21 @@ class SimpleReportGenerator:
             path = Path(filepath)
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(self.generate_json_report(report))
+            # Write the encoded bytes directly (no str decode/encode round trip)
+            path.write_bytes(dumps_json_bytes(report.to_json()))
             
             return True
         except Exception as e:
-            print(colorize(f"{Icons.CROSS} Error saving JSON report: {str(e)}", 
-                          Colors.ERROR))
+            print(self._colorize(f"{Icons.CROSS} Error saving JSON report: {str(e)}", 
+                                Colors.ERROR))
             return False
     
     # ========================================================================
     # Markdown Report Generation
     # ========================================================================
     
-    def generate_markdown_report(self, report: AnomalyReport) -> str:
+    def generate_markdown_report(self, report: AnomalyReport,
+                                 cache: Optional[_ReportCache] = None) -> str:
         """
         Generate Markdown report for documentation
         
@@ -776,122 +981,135 @@ class SimpleReportGenerator:
         
         Args:
             report: AnomalyReport
+            cache: Precomputed anomaly subsets (built from report if None)
             
         Returns:
             Markdown formatted report
         """
-        lines = []
+        buf = io.StringIO()
+        self._write_markdown_report(report, buf.write, cache)
+        return buf.getvalue()
+    
+    # Report builders indexed by ReportFormat, resolved once here; bind
+    # them with __get__ (the JSON builder is a staticmethod)
+    _DISPATCH = (generate_text_report, generate_json_report, generate_markdown_report)
+    
+    def _write_markdown_report(self, report: AnomalyReport,
+                               write: Callable[[str], None],
+                               cache: Optional[_ReportCache] = None) -> None:
+        """Write the Markdown report line by line through `write`"""
+        if cache is None:
+            cache = _ReportCache.from_report(report)
         
         # Title
-        lines.append("# 🛡 FPGA Trojan Detection Report")
-        lines.append("")
+        write("# 🛡 FPGA Trojan Detection Report\n")
+        write("\n")
         
         # Verdict badge
-        routing_mods = len(report.get_routing_anomalies())
+        routing_mods = len(cache.routing_anomalies)
         if report.trojan_detected:
-            lines.append("🚨 **VERDICT: TROJAN DETECTED** 🚨")
+            write("🚨 **VERDICT: TROJAN DETECTED** 🚨\n")
         elif report.critical_count > 0 or report.high_count > 0:
-            lines.append("⚠️ **VERDICT: SUSPICIOUS MODIFICATIONS FOUND**")
+            write("⚠️ **VERDICT: SUSPICIOUS MODIFICATIONS FOUND**\n")
         elif len(report) > 0 or routing_mods > 0 or report.total_bits_changed > 0:
-            lines.append("⚠️ **VERDICT: MODIFICATIONS DETECTED**")
+            write("⚠️ **VERDICT: MODIFICATIONS DETECTED**\n")
         else:
-            lines.append("✅ **VERDICT: NO SIGNIFICANT ANOMALIES**")
+            write("✅ **VERDICT: NO SIGNIFICANT ANOMALIES**\n")
         
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        write("\n")
+        write("---\n")
+        write("\n")
         
         # Metadata
-        lines.append("## 📋 Detection Metadata")
-        lines.append("")
-        lines.append(f"- **Golden Baseline:** `{report.golden_id}`")
-        lines.append(f"- **Suspect Bitstream:** `{report.suspect_id}`")
-        lines.append(f"- **Detection Time:** {report.detection_timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"- **Confidence:** {report.confidence:.1%}")
-        lines.append("")
+        write("## 📋 Detection Metadata\n")
+        write("\n")
+        write(f"- **Golden Baseline:** `{report.golden_id}`\n")
+        write(f"- **Suspect Bitstream:** `{report.suspect_id}`\n")
+        write(f"- **Detection Time:** {cache.detection_time}\n")
+        write(f"- **Confidence:** {report.confidence:.1%}\n")
+        write("\n")
         
         # Statistics
-        lines.append("## 📊 Statistics")
-        lines.append("")
-        lines.append("| Metric | Value |")
-        lines.append("|--------|-------|")
-        lines.append(f"| Frames Compared | {report.total_frames_compared:,} |")
-        lines.append(f"| Frames Modified | {report.frames_with_differences:,} |")
-        lines.append(f"| Total Bits Changed | {report.total_bits_changed:,} |")
-        lines.append(f"| Total Anomalies | {len(report):,} |")
-        lines.append("")
+        write("## 📊 Statistics\n")
+        write("\n")
+        write(_MD_STATS_TMPL.format(fc=report.total_frames_compared,
+                                    fm=report.frames_with_differences,
+                                    tb=report.total_bits_changed,
+                                    ta=len(report)))
+        write("\n")
         
         # Severity breakdown
-        lines.append("### Severity Distribution")
-        lines.append("")
-        lines.append("| Severity | Count |")
-        lines.append("|----------|-------|")
-        lines.append(f"| 🔴 CRITICAL | {report.critical_count} |")
-        lines.append(f"| 🟡 HIGH | {report.high_count} |")
-        lines.append(f"| 🔵 MEDIUM | {report.medium_count} |")
-        lines.append(f"| ⚪ LOW | {report.low_count} |")
-        lines.append("")
+        write("### Severity Distribution\n")
+        write("\n")
+        write(_MD_SEVERITY_TMPL.format(critical=report.critical_count,
+                                       high=report.high_count,
+                                       medium=report.medium_count,
+                                       low=report.low_count))
+        write("\n")
         
         # Type breakdown
         if report.type_counts:
-            lines.append("### Anomaly Types")
-            lines.append("")
-            lines.append("| Type | Count |")
-            lines.append("|------|-------|")
-            for atype, count in sorted(report.type_counts.items(), 
-                                      key=lambda x: x[1], reverse=True)[:10]:
-                lines.append(f"| {atype} | {count} |")
-            lines.append("")
+            write("### Anomaly Types\n")
+            write("\n")
+            write("| Type | Count |\n")
+            write("|------|-------|\n")
+            row = _MD_TYPE_ROW_TMPL.format
+            write("".join(row(atype, count) for atype, count in cache.top_types))
+            write("\n")
         
         # Critical findings
         if report.critical_count > 0:
-            lines.append("## 🚨 Critical Findings")
-            lines.append("")
-            for i, anomaly in enumerate(report.get_critical_anomalies(), 1):
-                lines.append(f"### {i}. {anomaly.far_hex} - {anomaly.block_type_name}")
-                lines.append("")
-                lines.append(f"- **Type:** {anomaly.anomaly_type.value}")
-                lines.append(f"- **Bits Changed:** {anomaly.bits_changed}")
-                lines.append(f"- **Location:** Column {anomaly.column}, Minor {anomaly.minor}")
-                lines.append(f"- **Reason:** {anomaly.suspicion_reason}")
+            write("## 🚨 Critical Findings\n")
+            write("\n")
+            for i, anomaly in enumerate(cache.critical_anomalies, 1):
+                # Fixed part of the entry in one joined write (trailing "" ends the last line)
+                write("\n".join((
+                    f"### {i}. {anomaly.far_hex} - {anomaly.block_type_name}",
+                    "",
+                    f"- **Type:** {anomaly.anomaly_type.value}",
+                    f"- **Bits Changed:** {anomaly.bits_changed}",
+                    f"- **Location:** Column {anomaly.column}, Minor {anomaly.minor}",
+                    f"- **Reason:** {anomaly.suspicion_reason}",
+                    "",
+                )))
                 if anomaly.attack_vectors:
-                    lines.append(f"- **Attack Vectors:** {', '.join(anomaly.attack_vectors)}")
-                lines.append("")
+                    write(f"- **Attack Vectors:** {', '.join(anomaly.attack_vectors)}\n")
+                write("\n")
         
         # Unused regions
-        unused_anomalies = report.get_unused_region_anomalies()
+        unused_anomalies = cache.unused_anomalies
         if unused_anomalies:
-            lines.append("## 🛡 Unused Region Analysis")
-            lines.append("")
-            lines.append(f"Found **{len(unused_anomalies)} modifications** in unused regions.")
-            lines.append("")
-            lines.append("> ⚠️ **Note:** Unused regions are prime locations for hardware Trojan insertion.")
-            lines.append("")
+            write("## 🛡 Unused Region Analysis\n")
+            write("\n")
+            write(f"Found **{len(unused_anomalies)} modifications** in unused regions.\n")
+            write("\n")
+            write("> ⚠️ **Note:** Unused regions are prime locations for hardware Trojan insertion.\n")
+            write("\n")
         
         # Summary
         if report.summary:
-            lines.append("## 📝 Analysis Summary")
-            lines.append("")
+            write("## 📝 Analysis Summary\n")
+            write("\n")
             for line in report.summary.splitlines():
                 if line.strip():
-                    lines.append(line)
-            lines.append("")
+                    write(line)
+                    write("\n")
+            write("\n")
         
         # Footer
-        lines.append("---")
-        lines.append("")
-        lines.append(f"*Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        lines.append("")
-        
-        return "\n".join(lines)
+        write("---\n")
+        write("\n")
+        write(f"*Report generated: {cache.generated_at}*\n")
     
-    def save_markdown_report(self, report: AnomalyReport, filepath: str) -> bool:
+    def save_markdown_report(self, report: AnomalyReport, filepath: str,
+                             cache: Optional[_ReportCache] = None) -> bool:
         """
         Save Markdown report to file
         
         Args:
             report: AnomalyReport
             filepath: Output file path
+            cache: Precomputed anomaly subsets (built from report if None)
             
         Returns:
             True on success, False on error
@@ -900,13 +1118,14 @@ class SimpleReportGenerator:
             path = Path(filepath)
             path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Stream straight into the file instead of building the report first
             with open(path, 'w', encoding='utf-8') as f:
-                f.write(self.generate_markdown_report(report))
+                self._write_markdown_report(report, f.write, cache)
             
             return True
         except Exception as e:
-            print(colorize(f"{Icons.CROSS} Error saving Markdown report: {str(e)}", 
-                          Colors.ERROR))
+            print(self._colorize(f"{Icons.CROSS} Error saving Markdown report: {str(e)}", 
+                                Colors.ERROR))
             return False
     
     # ========================================================================
@@ -914,7 +1133,8 @@ class SimpleReportGenerator:
     # ========================================================================
     
     def save_text_report(self, report: AnomalyReport, filepath: str,
-                        detail_level: str = "detailed") -> bool:
+                        detail_level: str = "detailed",
+                        cache: Optional[_ReportCache] = None) -> bool:
         """
         Save text report to file
         
@@ -922,6 +1142,7 @@ class SimpleReportGenerator:
             report: AnomalyReport
             filepath: Output file path
             detail_level: Detail level for report
+            cache: Precomputed anomaly subsets (built from report if None)
             
         Returns:
             True on success, False on error
@@ -930,15 +1151,16 @@ class SimpleReportGenerator:
             path = Path(filepath)
             path.parent.mkdir(parents=True, exist_ok=True)
             
-            text = self.generate_text_report(report, detail_level)
+            # Files never get ANSI codes: render with the plain style set
+            text = self._render_text_report(report, detail_level, 80, _PLAIN_STYLES, cache)
             
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            # Encode once and hand the bytes over in a single write
+            path.write_bytes(text.encode('utf-8'))
             
             return True
         except Exception as e:
-            print(colorize(f"{Icons.CROSS} Error saving text report: {str(e)}", 
-                          Colors.ERROR))
+            print(self._colorize(f"{Icons.CROSS} Error saving text report: {str(e)}", 
+                                Colors.ERROR))
             return False
     
     def generate_all_formats(self, report: AnomalyReport, output_dir: str,
@@ -946,7 +1168,8 @@ class SimpleReportGenerator:
         """
         Generate report in all formats
         
-        Creates text, JSON, and Markdown versions of the report.
+        Creates text, JSON, and Markdown versions of the report. The three
+        files are written concurrently on worker threads.
         
         Args:
             report: AnomalyReport
@@ -960,27 +1183,31 @@ class SimpleReportGenerator:
         output_path.mkdir(parents=True, exist_ok=True)
         
         results = {}
+        # One pass over the anomalies serves both the text and Markdown reports
+        cache = _ReportCache.from_report(report)
         
-        # Text report
         text_path = output_path / f"{base_name}.txt"
-        if self.save_text_report(report, str(text_path), detail_level="detailed"):
-            results['text'] = str(text_path)
-            print(colorize(f"  {Icons.CHECKMARK} Saved text report: {text_path.name}", 
-                          Colors.SUCCESS))
-        
-        # JSON report
         json_path = output_path / f"{base_name}.json"
-        if self.save_json_report(report, str(json_path)):
-            results['json'] = str(json_path)
-            print(colorize(f"  {Icons.CHECKMARK} Saved JSON report: {json_path.name}", 
-                          Colors.SUCCESS))
-        
-        # Markdown report
         md_path = output_path / f"{base_name}.md"
-        if self.save_markdown_report(report, str(md_path)):
-            results['markdown'] = str(md_path)
-            print(colorize(f"  {Icons.CHECKMARK} Saved Markdown report: {md_path.name}", 
-                          Colors.SUCCESS))
+        
+        # Overlap the three builds and their file writes; results are
+        # collected in a fixed order so the console output stays stable
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            saves = [
+                ('text', "text", text_path, executor.submit(
+                    self.save_text_report, report, str(text_path),
+                    detail_level="detailed", cache=cache)),
+                ('json', "JSON", json_path, executor.submit(
+                    self.save_json_report, report, str(json_path))),
+                ('markdown', "Markdown", md_path, executor.submit(
+                    self.save_markdown_report, report, str(md_path), cache=cache)),
+            ]
+            
+            for key, label, path, future in saves:
+                if future.result():
+                    results[key] = str(path)
+                    print(self._colorize(f"  {Icons.CHECKMARK} Saved {label} report: {path.name}", 
+                                        Colors.SUCCESS))
         
         return results
 
@@ -989,13 +1216,24 @@ class SimpleReportGenerator:
 # Convenience Functions
 # ============================================================================
 
-def quick_report(report: AnomalyReport, format: str = "text") -> str:
+class ReportFormat(IntEnum):
+    """Output formats accepted by quick_report (index into SimpleReportGenerator._DISPATCH)"""
+    TEXT = 0
+    JSON = 1
+    MARKDOWN = 2
+
+
+def quick_report(report: AnomalyReport, format: Union[str, ReportFormat] = "text") -> str:
     """
     Quick report generation helper
     
+    format="auto" picks text on a terminal (unless NO_COLOR is set) and
+    JSON otherwise. The choice is made on the first "auto" call and kept;
+    call reset_auto_format() to detect again.
+    
     Args:
         report: AnomalyReport
-        format: "text", "json", or "markdown"
+        format: "text", "json", "markdown", "auto", or a ReportFormat
         
     Returns:
         Formatted report string
@@ -1003,27 +1241,120 @@ def quick_report(report: AnomalyReport, format: str = "text") -> str:
     Raises:
         ValueError: If format is unknown
     """
-    generator = SimpleReportGenerator()
+    return _RENDERERS[_resolve_format(format)](report)
+
+
+def quick_report_many(reports: Iterable[AnomalyReport],
+                      format: Union[str, ReportFormat] = "text",
+                      writer: Optional[Callable[[str], None]] = None) -> Optional[List[str]]:
+    """
+    Render many reports in one format
+    
+    The format is resolved once for the whole batch instead of once per
+    report.
+    
+    Args:
+        reports: AnomalyReports to render
+        format: Same choices as quick_report
+        writer: If given, called with each rendered report instead of
+                collecting them
+        
+    Returns:
+        Rendered reports in input order, or None when writer is given
+        
+    Raises:
+        ValueError: If format is unknown
+    """
+    render = _RENDERERS[_resolve_format(format)]
+    if writer is None:
+        return [render(report) for report in reports]
+    for report in reports:
+        writer(render(report))
+    return None
+
+
+def make_reporter(format: Union[str, ReportFormat] = "text") -> Callable[[AnomalyReport], str]:
+    """
+    Get a renderer specialized to one format
+    
+    The format (including "auto") is resolved here, once; the returned
+    callable goes straight to the shared generator's builder with no
+    dispatch per call.
     
-    if format == "text":
-        return generator.generate_text_report(report)
-    elif format == "json":
-        return generator.generate_json_report(report)
-    elif format == "markdown":
-        return generator.generate_markdown_report(report)
+    Usage:
+        to_json = make_reporter("json")
+        for report in reports:
+            publish(to_json(report))
+    
+    Args:
+        format: Same choices as quick_report
+        
+    Returns:
+        Callable rendering an AnomalyReport to a string
+        
+    Raises:
+        ValueError: If format is unknown
+    """
+    return _RENDERERS[_resolve_format(format)]
+
+
+def _resolve_format(format: Union[str, ReportFormat]) -> ReportFormat:
+    """Map a format name, "auto", or ReportFormat to its ReportFormat"""
+    try:
+        return _FORMAT_INDEX[format]
+    except (KeyError, TypeError):  # TypeError: unhashable format argument
+        if format != "auto":
+            raise ValueError(_FORMAT_ERROR_TMPL.format(format)) from None
+    return _AUTO_FORMAT if _AUTO_FORMAT is not None else _detect_auto_format()
+
+
+# Shared by quick_report calls; renders keep no per-report state on it and
+# text styles are re-resolved on every render
+_DEFAULT_GENERATOR = SimpleReportGenerator()
+# _DISPATCH bound to the shared generator once, indexed by ReportFormat
+_RENDERERS = tuple(build.__get__(_DEFAULT_GENERATOR) for build in SimpleReportGenerator._DISPATCH)
+# Format names and ReportFormat members both resolve in one lookup; the
+# enum is the single source of truth for what quick_report accepts
+# (names are interned so literal "text"/"json"/"markdown" arguments match
+# the keys by identity; lower() alone would build fresh strings)
+_FORMAT_NAMES = tuple(sys.intern(fmt.name.lower()) for fmt in ReportFormat)
+_FORMAT_INDEX: Dict[Union[str, ReportFormat], ReportFormat] = dict(zip(_FORMAT_NAMES, ReportFormat))
+_FORMAT_INDEX.update({fmt: fmt for fmt in ReportFormat})
+_FORMAT_ERROR_TMPL = f"Unknown format: {{}}. Use {', '.join(map(repr, _FORMAT_NAMES))}, or 'auto'"
+
+# What format="auto" resolved to (None until the first "auto" call)
+_AUTO_FORMAT: Optional[ReportFormat] = None
+
+
+def _detect_auto_format() -> ReportFormat:
+    """Resolve format="auto" once: text on a terminal without NO_COLOR, else JSON"""
+    global _AUTO_FORMAT
+    if sys.stdout.isatty() and os.environ.get("NO_COLOR") is None:
+        _AUTO_FORMAT = ReportFormat.TEXT
     else:
-        raise ValueError(f"Unknown format: {format}. Use 'text', 'json', or 'markdown'")
+        _AUTO_FORMAT = ReportFormat.JSON
+    return _AUTO_FORMAT
+
+
+def reset_auto_format() -> None:
+    """Forget the format="auto" choice so the next call detects it again"""
+    global _AUTO_FORMAT
+    _AUTO_FORMAT = None
 
 
 # ============================================================================
 # Module Exports
 # ============================================================================
 
-__all__ = [
+__all__ = (
     'SimpleReportGenerator',
     'quick_report',
+    'quick_report_many',
+    'make_reporter',
+    'reset_auto_format',
+    'ReportFormat',
     'Colors',
     'Icons',
     'SEVERITY_ICONS',
     'SEVERITY_COLORS',
-]
+)